@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Any, Dict, List, Optional, TextIO
+
+from day import Day
+from registry import load_day_class
+from serve import json_default
+
+BatchResult = Dict[str, Any]
+
+
+def batch_input_files(pattern: str) -> List[str]:
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    return sorted(file_name for file_name in glob.glob(pattern) if os.path.isfile(file_name))
+
+
+def _initialize_worker(use_parse_cache: bool, collect_metrics: bool) -> None:
+    Day.use_parse_cache = use_parse_cache
+    Day.collect_metrics = collect_metrics
+
+
+def _solve_input(day_number: int, input_file: str, parts: List[int], parameters: Dict[str, str]) -> BatchResult:
+    day = load_day_class(day_number)(input_file)
+    result: BatchResult = {"day": type(day).__name__, "input": input_file, "parameters": parameters}
+    try:
+        day.configure(parameters)
+        start_time = perf_counter()
+        day.data
+        result["parse_duration"] = perf_counter() - start_time
+        for part in parts:
+            start_time = perf_counter()
+            result["part_{}".format(part)] = getattr(day, "part_{}".format(part))()
+            result["part_{}_duration".format(part)] = perf_counter() - start_time
+            if day.metrics:
+                result["part_{}_metrics".format(part)] = day.metrics
+                day.metrics = {}
+    except Exception as error:
+        result["error"] = "{}: {}".format(type(error).__name__, error)
+    return result
+
+
+def run_batch(
+    day_number: int,
+    input_files: List[str],
+    parts: List[int],
+    parameters: Dict[str, str],
+    jobs: Optional[int] = None,
+    use_parse_cache: bool = False,
+    collect_metrics: bool = False,
+    output: TextIO = sys.stdout,
+) -> None:
+    assert input_files, "No input files to solve"
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_initialize_worker, initargs=(use_parse_cache, collect_metrics)
+    ) as executor:
+        futures = [
+            executor.submit(_solve_input, day_number, input_file, parts, parameters) for input_file in input_files
+        ]
+        for future in as_completed(futures):
+            output.write(json.dumps(future.result(), default=json_default) + "\n")
+            output.flush()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import csv
+import gc
+import json
+import math
+import statistics
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from day import Day
+
+PHASES = ("load_data", "parse_data", "part_1", "part_2")
+
+BenchmarkResult = Dict[str, object]
+
+
+def measure(
+    function: Callable[[], object], setup: Optional[Callable[[], None]], warmup: int, repeat: int, disable_gc: bool
+) -> List[float]:
+    durations = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        gc_was_enabled = gc.isenabled()
+        if disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            start_time = perf_counter()
+            function()
+            duration = perf_counter() - start_time
+        finally:
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+        if i >= warmup:
+            durations.append(duration)
+    return durations
+
+
+def _percentile(durations: List[float], percentile: float) -> float:
+    ordered = sorted(durations)
+    return ordered[max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize(
+    day_name: str,
+    input_file: str,
+    parameters: Dict[str, str],
+    phase: str,
+    durations: List[float],
+    metrics: Optional[Dict[str, int]] = None,
+) -> BenchmarkResult:
+    return {
+        "day": day_name,
+        "input": input_file,
+        "parameters": ",".join("{}={}".format(name, value) for name, value in parameters.items()),
+        "phase": phase,
+        "repeat": len(durations),
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "p95": _percentile(durations, 95),
+        "metrics": metrics or {},
+    }
+
+
+def benchmark_phases(
+    day: Day, warmup: int, repeat: int, disable_gc: bool
+) -> Tuple[Dict[str, List[float]], Dict[str, Dict[str, int]]]:
+    phase_durations = {
+        "load_data": measure(day.load_data, None, warmup, repeat, disable_gc),
+        "parse_data": measure(day.parse_data, None, warmup, repeat, disable_gc),
+    }
+    phase_metrics = {}
+    for part in (1, 2):
+        if getattr(day, "part_{}_solution".format(part)) is None:
+            continue
+        part_function = getattr(day, "part_{}".format(part))
+        phase_durations["part_{}".format(part)] = measure(part_function, day.reparse, warmup, repeat, disable_gc)
+        # the metrics of the last run
+        phase_metrics["part_{}".format(part)] = day.metrics
+    return phase_durations, phase_metrics
+
+
+def benchmark_day(
+    day_class: Type[Day],
+    input_file: Optional[str],
+    parameters: Dict[str, str],
+    warmup: int,
+    repeat: int,
+    disable_gc: bool,
+) -> List[BenchmarkResult]:
+    day = day_class(input_file)
+    day.configure(parameters)
+    phase_durations, phase_metrics = benchmark_phases(day, warmup, repeat, disable_gc)
+    return [
+        summarize(day_class.__name__, day.input_file, parameters, phase, durations, phase_metrics.get(phase))
+        for phase, durations in phase_durations.items()
+    ]
+
+
+def print_results(results: List[BenchmarkResult]) -> None:
+    print("{:<6} {:<10} {:>10} {:>10} {:>10}  {}".format("day", "phase", "min [ms]", "median", "p95", "input"))
+    for result in results:
+        print(
+            "{:<6} {:<10} {:>10.2f} {:>10.2f} {:>10.2f}  {} {}".format(
+                result["day"],
+                result["phase"],
+                1000 * result["min"],
+                1000 * result["median"],
+                1000 * result["p95"],
+                result["input"],
+                result["parameters"],
+            )
+        )
+        if result["metrics"]:
+            print("{:<17} {}".format("", format_metrics(result["metrics"])))
+
+
+def format_metrics(metrics: Dict[str, int]) -> str:
+    return ", ".join("{}: {}".format(name, count) for name, count in sorted(metrics.items()))
+
+
+def write_results(file_name: str, results: List[BenchmarkResult], settings: Dict[str, object]) -> None:
+    if file_name.endswith(".csv"):
+        with open(file_name, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows({**result, "metrics": json.dumps(result["metrics"])} for result in results)
+        return
+
+    assert file_name.endswith(".json"), "Benchmark output must be a .json or .csv file"
+    with open(file_name, "w") as fh:
+        json.dump({"settings": settings, "results": results}, fh, indent=2)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from day import Day
+
+CACHE_DIRECTORY = ".cache"
+PARSE_CACHE_DIRECTORY = os.path.join(CACHE_DIRECTORY, "parsed")
+VERIFIED_DAYS_FILE = os.path.join(CACHE_DIRECTORY, "verified_days.json")
+CHECKPOINT_DIRECTORY = os.path.join(CACHE_DIRECTORY, "checkpoints")
+# seconds between two checkpoints of a solver
+CHECKPOINT_INTERVAL = 60.0
+
+# the directory of the helper modules (day, grid, search, ...) that days share
+SHARED_DIRECTORY = os.path.dirname(os.path.abspath(inspect.getsourcefile(Day)))
+
+
+def file_digest(file_name: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def imported_sources(source_file: str) -> List[str]:
+    # the source file and the shared modules it imports, directly or through other shared modules
+    sources = [source_file]
+    index = 0
+    while index < len(sources):
+        with open(sources[index]) as fh:
+            tree = ast.parse(fh.read())
+        index += 1
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                module_names = [node.module]
+            else:
+                continue
+            for module_name in module_names:
+                file_name = os.path.join(SHARED_DIRECTORY, module_name.split(".")[0] + ".py")
+                if os.path.exists(file_name) and file_name not in sources:
+                    sources.append(file_name)
+    return sources
+
+
+def day_digest(day: Day) -> str:
+    # the input and all code that affects the results of the day
+    digest = hashlib.sha256()
+    for file_name in [day.input_file] + imported_sources(os.path.abspath(inspect.getsourcefile(type(day)))):
+        digest.update(file_digest(file_name).encode())
+    return digest.hexdigest()
+
+
+def _parse_cache_file_name(day: Day) -> str:
+    return os.path.join(PARSE_CACHE_DIRECTORY, "{}_{}".format(type(day).__name__, day_digest(day)[:16]))
+
+
+def load_parsed_data(day: Day) -> Tuple[bool, Any]:
+    file_name = _parse_cache_file_name(day)
+    if os.path.exists(file_name + ".npy"):
+        return True, np.load(file_name + ".npy", allow_pickle=False)
+    if os.path.exists(file_name + ".pickle"):
+        with open(file_name + ".pickle", "rb") as fh:
+            return True, pickle.load(fh)
+    return False, None
+
+
+def store_parsed_data(day: Day, data: Any) -> None:
+    file_name = _parse_cache_file_name(day)
+    os.makedirs(PARSE_CACHE_DIRECTORY, exist_ok=True)
+    # numpy arrays are stored natively, which is faster and doesn't need to unpickle objects
+    if isinstance(data, np.ndarray) and data.dtype != object:
+        extension = ".npy"
+        with open(file_name + extension + ".tmp", "wb") as fh:
+            np.save(fh, data, allow_pickle=False)
+    else:
+        extension = ".pickle"
+        with open(file_name + extension + ".tmp", "wb") as fh:
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(file_name + extension + ".tmp", file_name + extension)
+
+
+def _load_verified_days() -> Dict[str, str]:
+    if not os.path.exists(VERIFIED_DAYS_FILE):
+        return {}
+    with open(VERIFIED_DAYS_FILE) as fh:
+        return json.load(fh)
+
+
+def is_verified(day: Day) -> bool:
+    return _load_verified_days().get(type(day).__name__) == day_digest(day)
+
+
+def store_verified(day: Day) -> None:
+    verified_days = _load_verified_days()
+    verified_days[type(day).__name__] = day_digest(day)
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    with open(VERIFIED_DAYS_FILE, "w") as fh:
+        json.dump(verified_days, fh, indent=2, sort_keys=True)
+
+
+def checkpoint_file_name(day: Day, name: str) -> str:
+    # a checkpoint only fits the same input, code and parameters
+    digest = hashlib.sha256()
+    digest.update(day_digest(day).encode())
+    digest.update(json.dumps(day.parameters, sort_keys=True).encode())
+    file_name = "{}_{}_{}.pickle".format(type(day).__name__, name.replace(" ", "_"), digest.hexdigest()[:16])
+    return os.path.join(CHECKPOINT_DIRECTORY, file_name)
+
+
+class Checkpoint:
+    # the progress of a long running solver: it loads the checkpoint once, saves its state whenever is_due and
+    # clears it once it's done; without a file name checkpoints are disabled and is_due is never true
+    def __init__(self, file_name: Optional[str], interval: float = CHECKPOINT_INTERVAL) -> None:
+        self.file_name = file_name
+        self.interval = interval
+        self._save_time = monotonic()
+
+    @property
+    def is_due(self) -> bool:
+        return self.file_name is not None and monotonic() - self._save_time >= self.interval
+
+    def load(self) -> Optional[Any]:
+        if self.file_name is None or not os.path.exists(self.file_name):
+            return None
+        with open(self.file_name, "rb") as fh:
+            return pickle.load(fh)
+
+    def save(self, state: Any) -> None:
+        assert self.file_name is not None, "Checkpoints are disabled"
+        os.makedirs(CHECKPOINT_DIRECTORY, exist_ok=True)
+        # an interruption while saving leaves the previous checkpoint intact
+        with open(self.file_name + ".tmp", "wb") as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(self.file_name + ".tmp", self.file_name)
+        self._save_time = monotonic()
+
+    def clear(self) -> None:
+        if self.file_name is not None and os.path.exists(self.file_name):
+            os.remove(self.file_name)
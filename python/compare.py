@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import statistics
+from typing import Any, List
+
+from bench import measure
+from day import Day
+
+
+def compare_strategies(
+    day: Day, parts: List[int], use_solutions: bool, warmup: int, repeat: int, disable_gc: bool
+) -> None:
+    day_name = type(day).__name__
+    mismatches = []
+    print("{:<6} {:<5} {:<12} {:>12} {:>8}".format("day", "part", "strategy", "median [ms]", "speedup"))
+    for part in parts:
+        solution = getattr(day, "part_{}_solution".format(part))
+        if solution is None:
+            continue
+
+        expected: Any = solution if use_solutions else None
+        reference_duration = None
+        for name, function in day.strategies(part).items():
+            day.reparse()
+            result = function()
+            # without a known solution the reference strategy is the oracle
+            if expected is None:
+                expected = result
+            if result != expected:
+                mismatches.append("{} part {} {}: {} != {}".format(day_name, part, name, result, expected))
+
+            duration = statistics.median(measure(function, day.reparse, warmup, repeat, disable_gc))
+            if reference_duration is None:
+                reference_duration = duration
+            print(
+                "{:<6} {:<5} {:<12} {:>12.2f} {:>7.1f}x".format(
+                    day_name, part, name, 1000 * duration, reference_duration / duration
+                )
+            )
+
+    assert not mismatches, "Strategies disagree: {}".format("; ".join(mismatches))
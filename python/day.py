@@ -1,21 +1,212 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import mmap
 import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+if TYPE_CHECKING:
+    from cache import Checkpoint
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+# the size of the blocks streamed from input files, they are extended to the end of their last line
+STREAM_CHUNK_SIZE = 1 << 20
+
+
+def strategy(part: int, name: str) -> Callable[[Method], Method]:
+    # registers an alternative implementation of a part, part_N itself is the reference strategy
+    def register(method: Method) -> Method:
+        method.strategy = (part, name)  # type: ignore
+        return method
+
+    return register
+
+
+# parsed data made of these only is immutable already
+IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, type(None), range, frozenset)
+
+
+def freeze(data: Any) -> Any:
+    # the parsed data is shared by the parts, so it's made immutable: numpy arrays in it are made read-only, dicts
+    # become read-only views, sets frozensets and lists tuples; parts copy what they change
+    numpy = sys.modules.get("numpy")
+    if isinstance(data, IMMUTABLE_TYPES):
+        return data
+    if numpy is not None and isinstance(data, numpy.generic):
+        return data
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        assert data.dtype != object, "Parsed numpy arrays can't hold objects"
+        data.flags.writeable = False
+        return data
+    if isinstance(data, (dict, MappingProxyType)):
+        # a copy, missing keys of a defaultdict would still be added through a view
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, set):
+        return frozenset(data)
+    if isinstance(data, list):
+        return tuple(freeze(item) for item in data)
+    if isinstance(data, tuple):
+        items = [freeze(item) for item in data]
+        if any(new_item is not item for new_item, item in zip(items, data)):
+            return type(data)._make(items) if hasattr(data, "_fields") else type(data)(items)
+        return data
+    assert False, "Can't freeze parsed data of type {}, use (named) tuples, lists, dicts, sets and numpy arrays".format(
+        type(data).__name__
+    )
 
 
 class Day(ABC):
-    def __init__(self, day_number: int) -> None:
+    # opt-in, reuses the parsed data of earlier runs with the same input and code
+    use_parse_cache = False
+    # opt-in, solvers count the work they do (states, nodes, iterations) with count()
+    collect_metrics = False
+    # opt-in, long running solvers save their progress with checkpoint() and continue from it
+    use_checkpoints = False
+    # opt-in, parts that consume records() read them straight from the input file instead of the parsed data
+    use_streaming = False
+    # tunable work sizes of the parts and their defaults, which the solutions are valid for
+    PARAMETERS: Dict[str, int] = {}
+    # method names of the strategies registered with @strategy, by part and name
+    STRATEGIES: Dict[int, Dict[str, str]] = {1: {}, 2: {}}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.STRATEGIES = {1: {}, 2: {}}
+        for attribute_name, attribute in vars(cls).items():
+            if hasattr(attribute, "strategy"):
+                part, name = attribute.strategy
+                cls.STRATEGIES[part][name] = attribute_name
+
+    def __init__(self, day_number: int, input_file: Optional[str] = None) -> None:
         self.day_number = day_number
-        self.raw_data = self.load_data()
+        self.input_file = input_file or os.path.join("day_{:02d}".format(day_number), "input")
+        # the input is only loaded and parsed once it's needed
+        self._input_buffer: Optional[Union[mmap.mmap, bytes]] = None
+        self._raw_data: Optional[List[str]] = None
+        self._data: Any = None
+        self._is_parsed = False
+        self.parameters = dict(self.PARAMETERS)
+        self.metrics: Dict[str, int] = {}
+
+    @property
+    def input_buffer(self) -> Union[mmap.mmap, bytes]:
+        if self._input_buffer is None:
+            with open(self.input_file, "rb") as fh:
+                # empty files can't be mapped
+                if os.fstat(fh.fileno()).st_size == 0:
+                    self._input_buffer = b""
+                else:
+                    self._input_buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._input_buffer
+
+    @property
+    def raw_data(self) -> List[str]:
+        if self._raw_data is None:
+            self._raw_data = self.load_data()
+        return self._raw_data
+
+    @property
+    def data(self) -> Any:
+        if not self._is_parsed:
+            self._data = freeze(self._parse_data_cached() if Day.use_parse_cache else self.parse_data())
+            self._is_parsed = True
+            # the text isn't needed anymore once it's parsed
+            self._raw_data = None
+        return self._data
+
+    @data.setter
+    def data(self, new_value: Any) -> None:
+        self._data = freeze(new_value)
+        self._is_parsed = True
+
+    def _parse_data_cached(self) -> Any:
+        from cache import load_parsed_data, store_parsed_data
+
+        is_cached, data = load_parsed_data(self)
+        if not is_cached:
+            data = self.parse_data()
+            store_parsed_data(self, data)
+        return data
+
+    def reparse(self) -> None:
+        # parts may keep results derived from the parsed data, timed runs start from a fresh parse
         self.data = self.parse_data()
+        self.metrics = {}
+
+    def configure(self, parameters: Dict[str, str]) -> None:
+        for name, value in parameters.items():
+            assert name in self.PARAMETERS, "{} has no parameter {}, it has: {}".format(
+                type(self).__name__, name, ", ".join(self.PARAMETERS) or "none"
+            )
+            self.parameters[name] = type(self.PARAMETERS[name])(value)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        # called once per loop with a total rather than per iteration, so it's cheap even when enabled
+        if Day.collect_metrics:
+            self.metrics[name] = self.metrics.get(name, 0) + amount
+
+    def checkpoint(self, name: str) -> "Checkpoint":
+        from cache import Checkpoint, checkpoint_file_name
+
+        return Checkpoint(checkpoint_file_name(self, name) if Day.use_checkpoints else None)
+
+    def strategies(self, part: int) -> Dict[str, Callable[[], Any]]:
+        strategies = {"reference": getattr(self, "part_{}".format(part))}
+        for name, method_name in self.STRATEGIES[part].items():
+            strategies[name] = getattr(self, method_name)
+        return strategies
+
+    def load_digit_grid(self) -> Any:
+        # one uint8 per digit straight from the file, without creating Python objects per character
+        import numpy as np
+
+        characters = np.frombuffer(self.input_buffer, dtype=np.uint8)
+        width = self.input_buffer.find(b"\n")
+        if width < 0:
+            width = len(characters)
+        # the last line may lack its newline
+        row_count = (len(characters) + 1) // (width + 1)
+        rows = np.lib.stride_tricks.as_strided(characters, (row_count, width), (width + 1, 1), writeable=False)
+        return rows - np.uint8(ord("0"))
+
+    def stream_chunks(self) -> Iterator[bytes]:
+        with open(self.input_file, "rb") as fh:
+            remainder = b""
+            for chunk in iter(lambda: fh.read(STREAM_CHUNK_SIZE), b""):
+                end = chunk.rfind(b"\n") + 1
+                if end == 0:
+                    remainder += chunk
+                    continue
+                yield remainder + chunk[:end]
+                remainder = chunk[end:]
+            if remainder:
+                yield remainder
+
+    def stream_lines(self) -> Iterator[str]:
+        # the lines of load_data without holding all of them
+        for chunk in self.stream_chunks():
+            lines = str(chunk, "utf-8").split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            for line in lines:
+                yield line.rstrip()
+
+    def records(self) -> Iterable[Any]:
+        # a single pass over the parsed records, which in streaming mode runs in constant memory for days that
+        # define parse_records, a generator of the same records as iterating over the parsed data gives
+        if Day.use_streaming and not self._is_parsed and hasattr(self, "parse_records"):
+            return self.parse_records()
+        return self.data
 
     def load_data(self) -> List[str]:
-        file_name = os.path.join("day_{:02d}".format(self.day_number), "input")
-        with open(file_name) as fh:
-            return [line.rstrip() for line in fh.readlines()]
+        lines = str(self.input_buffer, "utf-8").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [line.rstrip() for line in lines]
 
     @abstractmethod
     def parse_data(self) -> Any:
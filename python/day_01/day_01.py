@@ -1,22 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from collections import deque
+from typing import Iterable, Iterator, Optional
+
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 
-from day import Day
+from day import Day, strategy
 
 
 class Day01(Day):
-    def __init__(self) -> None:
-        super().__init__(1)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(1, input_file)
 
     def parse_data(self) -> np.ndarray:
         return np.array(self.raw_data, dtype=np.int)
 
+    def parse_records(self) -> Iterator[int]:
+        for chunk in self.stream_chunks():
+            yield from np.fromstring(chunk, dtype=np.int64, sep=" ").tolist()
+
     def part_1(self) -> int:
         return Day01._count_increases(self.data)
 
+    @strategy(1, "streaming")
+    def part_1_streaming(self) -> int:
+        return Day01._count_window_increases(self.records(), 1)
+
     @property
     def part_1_solution(self) -> int:
         return 1390
@@ -26,6 +37,10 @@ class Day01(Day):
         summed_windows = windows.sum(axis=1)
         return Day01._count_increases(summed_windows)
 
+    @strategy(2, "streaming")
+    def part_2_streaming(self) -> int:
+        return Day01._count_window_increases(self.records(), 3)
+
     @property
     def part_2_solution(self) -> int:
         return 1457
@@ -33,3 +48,14 @@ class Day01(Day):
     @staticmethod
     def _count_increases(data: np.ndarray) -> int:
         return len(np.where(np.diff(data) > 0)[0])
+
+    @staticmethod
+    def _count_window_increases(depths: Iterable[int], window_size: int) -> int:
+        # consecutive windows share all but their first and last depth, so only those two need to be compared
+        window = deque(maxlen=window_size + 1)
+        count = 0
+        for depth in depths:
+            window.append(depth)
+            if len(window) > window_size and window[-1] > window[0]:
+                count += 1
+        return count
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(max(3, round(2000 * scale))):
+        depth = max(depth + rng.randint(-15, 20), 0)
+        depths.append(str(depth))
+    return depths
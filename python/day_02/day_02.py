@@ -1,33 +1,46 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 import numpy as np
 
-from day import Day
+from day import Day, strategy
 
 
 class Day02(Day):
-    def __init__(self) -> None:
-        super().__init__(2)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(2, input_file)
+
+    @staticmethod
+    def _parse_command(line: str) -> Tuple[int, int]:
+        direction, amount_str = line.split()
+        amount = int(amount_str)
+        if direction == "forward":
+            return (amount, 0)
+        if direction == "down":
+            return (0, amount)
+        if direction == "up":
+            return (0, -amount)
+        assert False
 
     def parse_data(self) -> np.ndarray:
-        def parse_line(line: str) -> Tuple[int, int]:
-            direction, amount_str = line.split()
-            amount = int(amount_str)
-            if direction == "forward":
-                return (amount, 0)
-            if direction == "down":
-                return (0, amount)
-            if direction == "up":
-                return (0, -amount)
-            assert False
-
-        return np.array([parse_line(line) for line in self.raw_data])
+        return np.array([Day02._parse_command(line) for line in self.raw_data])
+
+    def parse_records(self) -> Iterator[Tuple[int, int]]:
+        return map(Day02._parse_command, self.stream_lines())
 
     def part_1(self) -> int:
         return self.data.sum(axis=0).prod()
 
+    @strategy(1, "streaming")
+    def part_1_streaming(self) -> int:
+        position = 0
+        depth = 0
+        for forward, down in self.records():
+            position += forward
+            depth += down
+        return int(position * depth)
+
     @property
     def part_1_solution(self) -> int:
         return 2147104
@@ -40,6 +53,17 @@ class Day02(Day):
             depth += aim * command[0]
         return depth * self.data[:, 0].sum()
 
+    @strategy(2, "streaming")
+    def part_2_streaming(self) -> int:
+        position = 0
+        aim = 0
+        depth = 0
+        for forward, down in self.records():
+            position += forward
+            aim += down
+            depth += aim * forward
+        return int(position * depth)
+
     @property
     def part_2_solution(self) -> int:
         return 2044620088
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    directions = ["forward", "down", "up"]
+    return [
+        "{} {}".format(rng.choices(directions, weights=[4, 3, 2])[0], rng.randint(1, 9))
+        for _ in range(max(1, round(1000 * scale)))
+    ]
@@ -1,17 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 import numpy as np
 
 from day import Day
 
 
 class Day03(Day):
-    def __init__(self) -> None:
-        super().__init__(3)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(3, input_file)
 
     def parse_data(self) -> np.ndarray:
-        return np.array([list(line) for line in self.raw_data], dtype=int)
+        return self.load_digit_grid()
 
     def part_1(self) -> int:
         bits = np.median(self.data, axis=0).astype(int)
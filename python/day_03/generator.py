@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def _find_co2_dead_end(numbers: List[int], width: int) -> int:
+    # returns the index of the number that makes the CO2 filter of part 2 discard all candidates, or -1
+    candidates = list(range(len(numbers)))
+    for bit in reversed(range(width)):
+        if len(candidates) <= 1:
+            break
+        ones = [index for index in candidates if numbers[index] >> bit & 1]
+        if len(ones) in (0, len(candidates)):
+            return candidates[0]
+        zeros = [index for index in candidates if not numbers[index] >> bit & 1]
+        candidates = zeros if len(zeros) <= len(ones) else ones
+    return -1
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    count = max(2, round(1000 * scale))
+    width = max(12, math.ceil(math.log2(count)) + 2)
+    numbers = rng.sample(range(2**width), count)
+    unique_numbers = set(numbers)
+    while True:
+        # make sure there are numbers with both bit values wherever the filter would run out of candidates
+        index = _find_co2_dead_end(numbers, width)
+        if index < 0:
+            break
+        for bit in reversed(range(width)):
+            flipped_number = numbers[index] ^ (1 << bit)
+            if flipped_number not in unique_numbers:
+                numbers.append(flipped_number)
+                unique_numbers.add(flipped_number)
+                break
+    return ["{:0{}b}".format(number, width) for number in numbers]
@@ -1,17 +1,20 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Set, Tuple
+from typing import AbstractSet, List, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 
 from day import Day
 
 
-class Board:
-    def __init__(self, all_numbers: Set[int], rows_columns: List[Set[int]]):
-        self.all_numbers = all_numbers
-        self.rows_columns = rows_columns
+class Board(NamedTuple):
+    all_numbers: AbstractSet[int]
+    rows_columns: Sequence[AbstractSet[int]]
+
+    def copy(self) -> "Board":
+        # the parsed boards are frozen, the game is played on copies
+        return Board(set(self.all_numbers), [set(row_column) for row_column in self.rows_columns])
 
     @property
     def score(self):
@@ -22,9 +25,9 @@ class Board:
         numbers = np.array([[int(number) for number in line.split()] for line in lines])
         rows_columns = []
         for i in range(numbers.shape[0]):
-            rows_columns.append(set(numbers[i]))
-            rows_columns.append(set(numbers[:, i]))
-        return Board(set(numbers.flatten()), rows_columns)
+            rows_columns.append(frozenset(numbers[i]))
+            rows_columns.append(frozenset(numbers[:, i]))
+        return Board(frozenset(numbers.flatten()), tuple(rows_columns))
 
     def check_number(self, number: int) -> bool:
         has_won = False
@@ -37,18 +40,19 @@ class Board:
 
 
 class Day04(Day):
-    def __init__(self) -> None:
-        super().__init__(4)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(4, input_file)
 
-    def parse_data(self) -> Tuple[List[int], List[Board]]:
-        numbers = [int(number) for number in self.raw_data[0].split(",")]
+    def parse_data(self) -> Tuple[Tuple[int, ...], Tuple[Board, ...]]:
+        numbers = tuple(int(number) for number in self.raw_data[0].split(","))
         boards = []
         for i in range(2, len(self.raw_data), 6):
             boards.append(Board.parse(self.raw_data[i : i + 5]))
-        return (numbers, boards)
+        return (numbers, tuple(boards))
 
     def part_1(self) -> int:
         numbers, boards = self.data
+        boards = [board.copy() for board in boards]
         for number in numbers:
             for board in boards:
                 if board.check_number(number):
@@ -60,6 +64,7 @@ class Day04(Day):
 
     def part_2(self) -> int:
         numbers, boards = self.data
+        boards = [board.copy() for board in boards]
         boards_indexes = set(range(len(boards)))
         for number in numbers:
             for index, board in enumerate(boards):
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    lines = [",".join(str(number) for number in numbers)]
+    for _ in range(max(1, round(100 * scale))):
+        board_numbers = rng.sample(range(100), 25)
+        lines.append("")
+        for row in range(5):
+            lines.append(" ".join("{:>2}".format(number) for number in board_numbers[5 * row : 5 * row + 5]))
+    return lines
@@ -1,17 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Set, Tuple
+from typing import Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from day import Day
+from parsing import integer_table
 
+LINE_COLUMNS = ("x1", "y1", "x2", "y2")
 
-class Line:
-    def __init__(self, x1: int, y1: int, x2: int, y2: int) -> None:
-        self.x1 = x1
-        self.y1 = y1
-        self.x2 = x2
-        self.y2 = y2
+
+class Line(NamedTuple):
+    x1: int
+    y1: int
+    x2: int
+    y2: int
 
     @property
     def is_aligned(self) -> bool:
@@ -35,25 +37,23 @@ class Line:
                 points.add((self.x1 + dx * i, self.y1 + dy * i))
         return points
 
-    @staticmethod
-    def parse(line: str) -> "Line":
-        coordinates = line.split(" -> ")
-        start = coordinates[0].split(",")
-        end = coordinates[1].split(",")
-        return Line(int(start[0]), int(start[1]), int(end[0]), int(end[1]))
-
 
 class Day05(Day):
-    def __init__(self) -> None:
-        super().__init__(5)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(5, input_file)
 
     def parse_data(self) -> List[Line]:
-        return [Line.parse(line) for line in self.raw_data]
+        return [Line(*row) for row in integer_table(self.input_buffer, LINE_COLUMNS).tolist()]
+
+    def parse_records(self) -> Iterator[Line]:
+        for chunk in self.stream_chunks():
+            for row in integer_table(chunk, LINE_COLUMNS).tolist():
+                yield Line(*row)
 
     def part_1(self) -> int:
         covered_points = set()
         multiple_covered_points = set()
-        for line in self.data:
+        for line in self.records():
             if not line.is_aligned:
                 continue
             new_points = line.points
@@ -69,7 +69,7 @@ class Day05(Day):
     def part_2(self) -> int:
         covered_points = set()
         multiple_covered_points = set()
-        for line in self.data:
+        for line in self.records():
             new_points = line.points
             multiple_covered_points.update(covered_points.intersection(new_points))
             covered_points.update(new_points)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    size = 1000
+    lines = []
+    for _ in range(max(1, round(500 * scale))):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        match rng.randrange(3):
+            case 0:
+                x2, y2 = rng.randrange(size), y1
+            case 1:
+                x2, y2 = x1, rng.randrange(size)
+            case _:
+                dx = 1 if x1 < size // 2 else -1
+                dy = 1 if y1 < size // 2 else -1
+                length = rng.randint(1, min(size - 1 - x1 if dx > 0 else x1, size - 1 - y1 if dy > 0 else y1))
+                x2, y2 = x1 + dx * length, y1 + dy * length
+        lines.append("{},{} -> {},{}".format(x1, y1, x2, y2))
+    return lines
@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from collections import defaultdict
-from typing import Dict
+from collections import defaultdict, deque
+from typing import Dict, Optional
 
-from day import Day
+from day import Day, strategy
 
 
 class Day06(Day):
-    def __init__(self) -> None:
-        super().__init__(6)
+    PARAMETERS = {"generations_part_1": 80, "generations_part_2": 256}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(6, input_file)
 
     def parse_data(self) -> Dict[int, int]:
         grouped_timers = defaultdict(int)
@@ -18,19 +20,35 @@ class Day06(Day):
         return grouped_timers
 
     def part_1(self) -> int:
-        return self.simulate_lanternfish(80)
+        return self.simulate_lanternfish(self.parameters["generations_part_1"])
 
     @property
     def part_1_solution(self) -> int:
         return 394994
 
     def part_2(self) -> int:
-        return self.simulate_lanternfish(256)
+        return self.simulate_lanternfish(self.parameters["generations_part_2"])
 
     @property
     def part_2_solution(self) -> int:
         return 1765974267455
 
+    @strategy(1, "rotating")
+    def part_1_rotating(self) -> int:
+        return self._simulate_lanternfish_rotating(self.parameters["generations_part_1"])
+
+    @strategy(2, "rotating")
+    def part_2_rotating(self) -> int:
+        return self._simulate_lanternfish_rotating(self.parameters["generations_part_2"])
+
+    def _simulate_lanternfish_rotating(self, generations: int) -> int:
+        # counts by timer, rotating moves every timer down by one and the parents to 8
+        counts = deque(self.data.get(timer, 0) for timer in range(9))
+        for _ in range(generations):
+            counts.rotate(-1)
+            counts[6] += counts[8]
+        return sum(counts)
+
     def simulate_lanternfish(self, generations: int):
         population = self.data
         for _ in range(generations):
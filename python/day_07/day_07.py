@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from functools import lru_cache
+from typing import Optional
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from memo import Memo
 
 
 class Day07(Day):
-    def __init__(self) -> None:
-        super().__init__(7)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(7, input_file)
 
     def parse_data(self) -> np.ndarray:
         return np.array(self.raw_data[0].split(","), dtype=int)
@@ -24,9 +25,12 @@ class Day07(Day):
         return 356958
 
     def part_2(self) -> int:
+        # the crabs share few distinct distances
+        crab_cost = Memo(Day07.crab_cost)
+
         def calculate_cost(position: int) -> int:
             distance = np.abs(position - self.data)
-            return int(sum([Day07.crab_cost(cost) for cost in distance]))
+            return int(sum([crab_cost(cost) for cost in distance]))
 
         position = np.median(self.data)
         previous_cost = calculate_cost(position - 1)
@@ -40,10 +44,20 @@ class Day07(Day):
                 break
             previous_cost = cost
 
+        crab_cost.record(self.count, "crab cost")
         return previous_cost
 
+    @strategy(2, "mean")
+    def part_2_mean(self) -> int:
+        # the optimal position is less than 1/2 away from the mean
+        mean = int(np.floor(np.mean(self.data)))
+        costs = []
+        for position in (mean, mean + 1):
+            distance = np.abs(position - self.data)
+            costs.append(int((distance * (distance + 1) // 2).sum()))
+        return min(costs)
+
     @staticmethod
-    @lru_cache
     def crab_cost(distance: int) -> int:
         if distance % 2 == 0:
             return (distance + 1) * distance // 2
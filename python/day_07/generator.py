@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    return [",".join(str(int(rng.expovariate(1 / 450)) % 2000) for _ in range(max(1, round(1000 * scale))))]
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+DIGIT_SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    lines = []
+    for _ in range(max(1, round(200 * scale))):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        wiring = dict(zip("abcdefg", wires))
+
+        def scramble(digit: int) -> str:
+            pattern = [wiring[segment] for segment in DIGIT_SEGMENTS[digit]]
+            rng.shuffle(pattern)
+            return "".join(pattern)
+
+        patterns = [scramble(digit) for digit in rng.sample(range(10), 10)]
+        outputs = [scramble(rng.randrange(10)) for _ in range(4)]
+        lines.append("{} | {}".format(" ".join(patterns), " ".join(outputs)))
+    return lines
@@ -1,71 +1,57 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple
+from typing import Iterator, Optional
+
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from grid import neighbor_lists, neighbor_stack
+from search import breadth_first
 
 
 class Day09(Day):
-    def __init__(self) -> None:
-        super().__init__(9)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(9, input_file)
 
     def parse_data(self) -> np.ndarray:
-        return np.array([list(line) for line in self.raw_data], dtype=int)
+        return self.load_digit_grid()
 
     def part_1(self) -> int:
+        heights = self.data.reshape(-1).tolist()
+        offsets, neighbors = neighbor_lists(self.data.shape)
         risk_level = 0
-        for index, value in np.ndenumerate(self.data):
-            if value < min(self._neighbors(index)[0]):
-                risk_level += value + 1
+        for cell, height in enumerate(heights):
+            if height < min(heights[neighbor] for neighbor in neighbors[offsets[cell] : offsets[cell + 1]]):
+                risk_level += height + 1
         return risk_level
 
-    def _neighbors(self, index: Tuple[int, int]) -> Tuple[List[int], List[Tuple[int, int]]]:
-        x, y = index
-        neighbors = []
-        if x > 0:
-            neighbors.append((x - 1, y))
-        if y > 0:
-            neighbors.append((x, y - 1))
-        if x < self.data.shape[0] - 1:
-            neighbors.append((x + 1, y))
-        if y < self.data.shape[1] - 1:
-            neighbors.append((x, y + 1))
-        return [self.data[index] for index in neighbors], neighbors
+    @strategy(1, "vectorized")
+    def part_1_vectorized(self) -> int:
+        lowest_neighbors = neighbor_stack(self.data, fill=9).min(axis=0)
+        low_points = self.data[self.data < lowest_neighbors]
+        return int((low_points + 1).sum())
 
     @property
     def part_1_solution(self) -> int:
         return 500
 
     def part_2(self) -> int:
-        basin_sizes = []
-        for index, value in np.ndenumerate(self.data):
-            neighbors, indexes = self._neighbors(index)
-            if value >= min(neighbors):
-                continue
-
-            basin = set()
-            neighbors_to_check = set()
-            for i in range(len(neighbors)):
-                if neighbors[i] == 9:
-                    continue
+        heights = self.data.reshape(-1).tolist()
+        offsets, neighbors = neighbor_lists(self.data.shape)
 
-                basin.add(indexes[i])
-                neighbors_to_check.add(indexes[i])
+        def basin_neighbors(cell: int) -> Iterator[int]:
+            for neighbor in neighbors[offsets[cell] : offsets[cell + 1]]:
+                if heights[neighbor] != 9:
+                    yield neighbor
 
-            while neighbors_to_check:
-                neighbor_index = neighbors_to_check.pop()
-                new_neighbors, new_indexes = self._neighbors(neighbor_index)
-                for i in range(len(new_neighbors)):
-                    if new_neighbors[i] == 9:
-                        continue
-                    if new_indexes[i] in basin:
-                        continue
-
-                    neighbors_to_check.add(new_indexes[i])
-                    basin.add(new_indexes[i])
+        basin_sizes = []
+        for cell, height in enumerate(heights):
+            cell_neighbors = neighbors[offsets[cell] : offsets[cell + 1]]
+            if height >= min(heights[neighbor] for neighbor in cell_neighbors):
+                continue
 
+            basin = breadth_first(cell, basin_neighbors)
             basin_sizes.append(len(basin))
 
         return np.prod(sorted(basin_sizes, reverse=True)[:3])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from collections import deque
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    size = max(3, round(100 * math.sqrt(scale)))
+    # like in the puzzle input, basins grow from a low point and are separated by ridges of nines
+    basins = [-1] * (size * size)
+    heights = [0] * (size * size)
+    queue = deque()
+    for index in rng.sample(range(size * size), max(1, size * size // 60)):
+        basins[index] = index
+        queue.append(index)
+    while queue:
+        index = queue.popleft()
+        x, y = divmod(index, size)
+        for neighbor_x, neighbor_y in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
+            if not (0 <= neighbor_x < size and 0 <= neighbor_y < size):
+                continue
+            neighbor = neighbor_x * size + neighbor_y
+            if basins[neighbor] >= 0:
+                continue
+            basins[neighbor] = basins[index]
+            heights[neighbor] = min(heights[index] + rng.randint(0, 1) + 1, 8)
+            queue.append(neighbor)
+
+    lines = []
+    for x in range(size):
+        line = []
+        for y in range(size):
+            index = x * size + y
+            if (x > 0 and basins[index - size] != basins[index]) or (y > 0 and basins[index - 1] != basins[index]):
+                line.append("9")
+            else:
+                line.append(str(heights[index]))
+        lines.append("".join(line))
+    return lines
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List
+from typing import Iterator, List, Optional
 
 import numpy as np
 
@@ -11,16 +11,19 @@ brackets = {")": "(", "]": "[", "}": "{", ">": "<"}
 
 
 class Day10(Day):
-    def __init__(self) -> None:
-        super().__init__(10)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(10, input_file)
 
     def parse_data(self) -> List[str]:
         return self.raw_data
 
+    def parse_records(self) -> Iterator[str]:
+        return self.stream_lines()
+
     def part_1(self) -> int:
         score = 0
         points = {")": 3, "]": 57, "}": 1197, ">": 25137}
-        for line in self.data:
+        for line in self.records():
             open_brackets = []
             for character in line:
                 if character not in brackets:
@@ -41,7 +44,7 @@ class Day10(Day):
     def part_2(self) -> int:
         scores = []
         points = {"(": 1, "[": 2, "{": 3, "<": 4}
-        for line in self.data:
+        for line in self.records():
             open_brackets = []
             for character in line:
                 if character not in brackets:
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def _generate_line(rng: Random, corrupted: bool) -> str:
+    length = rng.randint(90, 110)
+    characters = []
+    open_brackets = []
+    corruption_index = rng.randrange(length // 2, length)
+    for i in range(length):
+        if corrupted and i >= corruption_index and open_brackets:
+            expected_bracket = BRACKETS[open_brackets[-1]]
+            characters.append(rng.choice([bracket for bracket in BRACKETS.values() if bracket != expected_bracket]))
+            corrupted = False
+            continue
+        if open_brackets and rng.random() < 0.45:
+            characters.append(BRACKETS[open_brackets.pop()])
+        else:
+            open_brackets.append(rng.choice(list(BRACKETS)))
+            characters.append(open_brackets[-1])
+    if not open_brackets:
+        # complete lines don't exist in the puzzle input
+        characters.append(rng.choice(list(BRACKETS)))
+    return "".join(characters)
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    line_count = max(1, round(110 * scale))
+    # the middle score of part 2 requires an odd number of incomplete lines
+    incomplete_count = line_count // 2 | 1
+    lines = [_generate_line(rng, False) for _ in range(incomplete_count)]
+    lines.extend(_generate_line(rng, True) for _ in range(line_count - incomplete_count))
+    rng.shuffle(lines)
+    return lines
@@ -1,45 +1,91 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from grid import stencil
+from jit import kernel
+
+# every octopus gives energy to all 8 neighbours when it flashes
+NEIGHBOR_WEIGHTS = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+
+@kernel
+def _flash_steps(energy_levels: np.ndarray, step_count: int) -> Tuple[int, int]:
+    # the flash count after step_count steps, or with a negative step_count the first step in which all flash
+    height, width = energy_levels.shape
+    # every octopus flashes at most once per step
+    flashing_cells = np.empty(height * width, dtype=np.int64)
+    flash_count = 0
+    step = 0
+    while step != step_count:
+        step += 1
+        flashing_count = 0
+        for x in range(height):
+            for y in range(width):
+                energy_levels[x, y] += 1
+                if energy_levels[x, y] == 10:
+                    flashing_cells[flashing_count] = x * width + y
+                    flashing_count += 1
+
+        step_flash_count = 0
+        while flashing_count > 0:
+            flashing_count -= 1
+            x = flashing_cells[flashing_count] // width
+            y = flashing_cells[flashing_count] % width
+            step_flash_count += 1
+            for i in range(max(x - 1, 0), min(x + 2, height)):
+                for j in range(max(y - 1, 0), min(y + 2, width)):
+                    energy_levels[i, j] += 1
+                    if energy_levels[i, j] == 10:
+                        flashing_cells[flashing_count] = i * width + j
+                        flashing_count += 1
+
+        for x in range(height):
+            for y in range(width):
+                if energy_levels[x, y] > 9:
+                    energy_levels[x, y] = 0
+        flash_count += step_flash_count
+        if step_count < 0 and step_flash_count == height * width:
+            break
+    return flash_count, step
 
 
 class Day11(Day):
-    def __init__(self) -> None:
-        super().__init__(11)
+    PARAMETERS = {"steps": 100}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(11, input_file)
 
     def parse_data(self) -> np.ndarray:
-        return np.array([list(line) for line in self.raw_data], dtype=int)
+        return self.load_digit_grid()
 
     @staticmethod
-    def _flash(own_data: np.ndarray, x: int, y: int) -> List[Tuple[int, int]]:
-        triggered_flashes = []
-        for i in range(max(x - 1, 0), min(x + 2, own_data.shape[0])):
-            for j in range(max(y - 1, 0), min(y + 2, own_data.shape[1])):
-                if own_data[i, j] == 9:
-                    triggered_flashes.append((i, j))
-                own_data[i, j] += 1
-        return triggered_flashes
+    def _step(energy_levels: np.ndarray) -> int:
+        energy_levels += 1
+        has_flashed = np.zeros(energy_levels.shape, dtype=bool)
+        while True:
+            is_flashing = (energy_levels > 9) & ~has_flashed
+            if not is_flashing.any():
+                break
+            has_flashed |= is_flashing
+            energy_levels += stencil(is_flashing, NEIGHBOR_WEIGHTS)
+
+        energy_levels[has_flashed] = 0
+        return int(has_flashed.sum())
 
     def part_1(self) -> int:
-        flash_count = 0
-        own_data = np.array(self.data)
-        for _ in range(100):
-            for index, _ in np.ndenumerate(own_data):
-                own_data[index] += 1
-                if own_data[index] == 10:
-                    additional_flashes = Day11._flash(own_data, *index)
-                    flash_count += 1 + len(additional_flashes)
-                    while additional_flashes:
-                        even_more_flashes = Day11._flash(own_data, *additional_flashes.pop())
-                        flash_count += len(even_more_flashes)
-                        additional_flashes.extend(even_more_flashes)
-
-            own_data[np.where(own_data > 9)] = 0
+        energy_levels = self.data.astype(int)
+        return sum(Day11._step(energy_levels) for _ in range(self.parameters["steps"]))
+
+    @strategy(1, "jit")
+    def part_1_jit(self) -> int:
+        if not _flash_steps.is_compiled:
+            return self.part_1()
+        flash_count, _ = _flash_steps(self.data.astype(np.int64), self.parameters["steps"])
         return flash_count
 
     @property
@@ -48,20 +94,19 @@ class Day11(Day):
 
     def part_2(self) -> int:
         step = 0
-        own_data = np.array(self.data)
-        while own_data.max() > 0:
-            for index, _ in np.ndenumerate(own_data):
-                own_data[index] += 1
-                if own_data[index] == 10:
-                    additional_flashes = Day11._flash(own_data, *index)
-                    while additional_flashes:
-                        even_more_flashes = Day11._flash(own_data, *additional_flashes.pop())
-                        additional_flashes.extend(even_more_flashes)
-
-            own_data[np.where(own_data > 9)] = 0
+        energy_levels = self.data.astype(int)
+        while energy_levels.max() > 0:
+            Day11._step(energy_levels)
             step += 1
         return step
 
+    @strategy(2, "jit")
+    def part_2_jit(self) -> int:
+        if not _flash_steps.is_compiled:
+            return self.part_2()
+        _, step = _flash_steps(self.data.astype(np.int64), -1)
+        return step
+
     @property
     def part_2_solution(self) -> int:
         return 314
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+import numpy as np
+
+from day_11.day_11 import Day11
+
+
+def _synchronizes(energy_levels: np.ndarray, max_steps: int) -> bool:
+    energy_levels = energy_levels.copy()
+    for _ in range(max_steps):
+        if Day11._step(energy_levels) == energy_levels.size:
+            return True
+    return False
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    size = max(2, round(10 * math.sqrt(scale)))
+    # most random grids never synchronize, which part 2 relies on; narrowing the energy levels makes it happen
+    for lowest_level in range(10):
+        energy_levels = np.array([[rng.randint(lowest_level, 9) for _ in range(size)] for _ in range(size)])
+        if _synchronizes(energy_levels, 1000):
+            break
+    return ["".join(str(level) for level in row) for row in energy_levels]
@@ -2,14 +2,15 @@
 # -*- coding: utf-8 -*-
 
 from collections import defaultdict
-from typing import DefaultDict, List, Set, Tuple
+from typing import DefaultDict, Iterator, List, Optional, Tuple
 
 from day import Day
+from search import count_paths
 
 
 class Day12(Day):
-    def __init__(self) -> None:
-        super().__init__(12)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(12, input_file)
 
     def parse_data(self) -> DefaultDict[str, List[str]]:
         result = defaultdict(list)
@@ -20,51 +21,42 @@ class Day12(Day):
 
         return result
 
-    def part_1(self) -> int:
-        open_paths = [["start", dest] for dest in self.data["start"]]
-        closed_paths = []
-        while open_paths:
-            current_path = open_paths.pop()
-            for dest in self.data[current_path[-1]]:
-                if dest.islower() and dest in current_path:
-                    continue
+    def _count_paths(self, may_revisit_small_cave: bool) -> int:
+        caves = sorted(self.data)
+        cave_indexes = {cave: i for i, cave in enumerate(caves)}
+        connections = [[cave_indexes[dest] for dest in self.data[cave] if dest != "start"] for cave in caves]
+        small_cave_bits = [1 << i if cave.islower() else 0 for i, cave in enumerate(caves)]
+        end = cave_indexes["end"]
+
+        # a state is the current cave, the visited small caves and whether one of them was visited twice
+        def successors(state: Tuple[int, int, bool]) -> Iterator[Tuple[int, int, bool]]:
+            cave, visited_small_caves, has_revisited = state
+            if cave == end:
+                return
+            for dest in connections[cave]:
+                if not visited_small_caves & small_cave_bits[dest]:
+                    yield dest, visited_small_caves | small_cave_bits[dest], has_revisited
+                elif not has_revisited:
+                    yield dest, visited_small_caves, True
+
+        start = cave_indexes["start"]
+        path_count, memo = count_paths(
+            (start, small_cave_bits[start], not may_revisit_small_cave), successors, lambda state: state[0] == end
+        )
+        self.count("paths", path_count)
+        self.count("states", len(memo))
+        memo.record(self.count, "path count")
+        return path_count
 
-                new_path = current_path + [dest]
-                if dest == "end":
-                    closed_paths.append(new_path)
-                else:
-                    open_paths.append(new_path)
-        return len(closed_paths)
+    def part_1(self) -> int:
+        return self._count_paths(False)
 
     @property
     def part_1_solution(self) -> int:
         return 4720
 
     def part_2(self) -> int:
-        open_paths: List[Tuple[Set[str], str, bool]] = [
-            (set(["start", dest]), dest, False) for dest in self.data["start"]
-        ]
-        path_count = 0
-        while open_paths:
-            current_path, current_location, has_visited_small_cave_twice = open_paths.pop()
-
-            for dest in self.data[current_location]:
-                if dest == "end":
-                    path_count += 1
-                    continue
-                if dest == "start":
-                    continue
-
-                if has_visited_small_cave_twice and dest.islower() and dest in current_path:
-                    continue
-
-                new_path = set(current_path)
-                new_path.add(dest)
-                open_paths.append(
-                    (new_path, dest, has_visited_small_cave_twice or (dest.islower() and dest in current_path))
-                )
-
-        return path_count
+        return self._count_paths(True)
 
     @property
     def part_2_solution(self) -> int:
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import string
+from itertools import product
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    # the number of paths grows exponentially with the number of caves
+    small_caves = ["".join(name) for name in product(string.ascii_lowercase, repeat=2)][: max(2, round(8 * scale))]
+    big_caves = ["".join(name) for name in product(string.ascii_uppercase, repeat=2)][: max(1, round(3 * scale))]
+    rng.shuffle(small_caves)
+    rng.shuffle(big_caves)
+
+    edges = set()
+    for cave in ["start", "end"]:
+        for neighbor in rng.sample(small_caves + big_caves, 3):
+            edges.add((cave, neighbor))
+    for big_cave in big_caves:
+        # big caves must never be connected to each other, otherwise there are infinitely many paths
+        for neighbor in rng.sample(small_caves, min(3, len(small_caves))):
+            edges.add((big_cave, neighbor))
+    for _ in range(len(small_caves)):
+        edges.add(tuple(sorted(rng.sample(small_caves, 2))))
+
+    lines = ["{}-{}".format(*edge) if rng.random() < 0.5 else "{1}-{0}".format(*edge) for edge in edges]
+    rng.shuffle(lines)
+    return lines
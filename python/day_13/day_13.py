@@ -1,30 +1,26 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Set, Tuple
-
-import matplotlib.pyplot as plt
+import re
+from typing import FrozenSet, Optional, Set, Tuple
 
 from day import Day
+from parsing import integer_table
+
+DOT_COLUMNS = ("x", "y")
+FOLD_PATTERN = re.compile(rb"fold along ([xy])=(\d+)")
 
 
 class Day13(Day):
-    def __init__(self) -> None:
-        super().__init__(13)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(13, input_file)
 
-    def parse_data(self) -> Tuple[Set[Tuple[int, ...]], List[Tuple[bool, int]]]:
-        dots = set()
-        folds = []
-        for line in self.raw_data:
-            if not line:
-                continue
-            if line.startswith("fold along "):
-                instruction = line.split()[-1]
-                direction, offset = tuple(instruction.split("="))
-                folds.append((direction == "x", int(offset)))
-            else:
-                dots.add(tuple(int(coordinate) for coordinate in line.split(",")))
-        return dots, folds
+    def parse_data(self) -> Tuple[FrozenSet[Tuple[int, ...]], Tuple[Tuple[bool, int], ...]]:
+        # the dots, a blank line and the folds
+        dots_end = self.input_buffer.find(b"\n\n")
+        dots = integer_table(self.input_buffer[:dots_end], DOT_COLUMNS)
+        folds = FOLD_PATTERN.findall(self.input_buffer, dots_end)
+        return frozenset(map(tuple, dots.tolist())), tuple((axis == b"x", int(offset)) for axis, offset in folds)
 
     def _fold(self, dots: Set[Tuple[int, int]], direction: bool, offset: int) -> None:
         dots_to_add = []
@@ -45,6 +41,8 @@ class Day13(Day):
 
     def part_1(self) -> int:
         dots, folds = self.data
+        # folding works in place on a copy of the parsed dots
+        dots = set(dots)
         self._fold(dots, *folds[0])
         return len(dots)
 
@@ -54,9 +52,11 @@ class Day13(Day):
 
     def part_2(self) -> str:
         dots, folds = self.data
+        dots = set(dots)
         for fold in folds:
             self._fold(dots, *fold)
 
+        # import matplotlib.pyplot as plt
         # dots_list = list(dots)
         # plt.figure()
         # plt.axis("equal")
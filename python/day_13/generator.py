@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    width = 2 * round(655 * math.sqrt(scale)) + 1
+    height = 2 * round(447 * math.sqrt(scale)) + 1
+
+    folds = []
+    fold_width, fold_height = width, height
+    while fold_width > 40 or fold_height > 6:
+        if fold_width > 40:
+            fold_width //= 2
+            folds.append("fold along x={}".format(fold_width))
+        if fold_height > 6:
+            fold_height //= 2
+            folds.append("fold along y={}".format(fold_height))
+    vertical_folds = {int(fold.split("=")[1]) for fold in folds if "x=" in fold}
+    horizontal_folds = {int(fold.split("=")[1]) for fold in folds if "y=" in fold}
+
+    dots = set()
+    while len(dots) < max(1, round(840 * scale)):
+        x, y = rng.randrange(width), rng.randrange(height)
+        # dots never appear on fold lines
+        if x not in vertical_folds and y not in horizontal_folds:
+            dots.add((x, y))
+    return ["{},{}".format(x, y) for x, y in dots] + [""] + folds
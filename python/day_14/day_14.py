@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from collections import defaultdict
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from day import Day
 
 
 class Day14(Day):
-    def __init__(self) -> None:
-        super().__init__(14)
+    PARAMETERS = {"steps_part_1": 10, "steps_part_2": 40}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(14, input_file)
 
     def parse_data(self) -> Tuple[str, Dict[str, str]]:
         template = self.raw_data[0]
@@ -36,14 +38,14 @@ class Day14(Day):
         return counts[-1] - counts[0]
 
     def part_1(self) -> int:
-        return self._apply_steps(10)
+        return self._apply_steps(self.parameters["steps_part_1"])
 
     @property
     def part_1_solution(self) -> int:
         return 2170
 
     def part_2(self) -> int:
-        return self._apply_steps(40)
+        return self._apply_steps(self.parameters["steps_part_2"])
 
     @property
     def part_2_solution(self) -> int:
@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from itertools import product
+from random import Random
+from typing import List
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    template = "".join(rng.choices(ELEMENTS, k=max(2, round(20 * scale))))
+    rules = ["{}{} -> {}".format(a, b, rng.choice(ELEMENTS)) for a, b in product(ELEMENTS, repeat=2)]
+    rng.shuffle(rules)
+    return [template, ""] + rules
@@ -1,70 +1,72 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from heapq import heappop, heappush
-from typing import List, Set, Tuple
+from typing import Optional
 
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from grid import neighbor_lists, neighbor_table
+from search import bucket_shortest_path, bucket_shortest_path_kernel
 
 
 class Day15(Day):
-    def __init__(self) -> None:
-        super().__init__(15)
+    PARAMETERS = {"tiling": 5}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(15, input_file)
 
     def parse_data(self) -> np.ndarray:
-        return np.array([list(line) for line in self.raw_data], dtype=int)
+        return self.load_digit_grid()
 
-    @staticmethod
-    def _neighbors(cave_map: np.ndarray, index: Tuple[int, int]) -> List[Tuple[int, Tuple[int, int]]]:
-        x, y = index
-        neighbors = []
-        if x > 0:
-            neighbors.append((cave_map[x - 1, y], (x - 1, y)))
-        if y > 0:
-            neighbors.append((cave_map[x, y - 1], (x, y - 1)))
-        if x < cave_map.shape[0] - 1:
-            neighbors.append((cave_map[x + 1, y], (x + 1, y)))
-        if y < cave_map.shape[1] - 1:
-            neighbors.append((cave_map[x, y + 1], (x, y + 1)))
-        return neighbors
+    def _lowest_total_risk(self, cave_map: np.ndarray) -> int:
+        offsets, neighbors = neighbor_lists(cave_map.shape)
+        risk_levels = cave_map.reshape(-1).tolist()
+        result = bucket_shortest_path(offsets, neighbors, risk_levels, 0, len(risk_levels) - 1)
+        self.count("expanded cells", result.expanded_count)
+        return result.cost
 
     @staticmethod
-    def _shortest_first(cave_map: np.ndarray) -> int:
-        found_nodes: Set[Tuple[int, int]] = set([(0, 0)])
-        paths: List[Tuple[int, Tuple[int, int]]] = [(0, (0, 0))]
-        target = (cave_map.shape[0] - 1, cave_map.shape[1] - 1)
-        while True:
-            cost, coordinate = heappop(paths)
-            neighbors = Day15._neighbors(cave_map, coordinate)
-            for neighbor_cost, neighbor_coordinate in neighbors:
-                if neighbor_coordinate in found_nodes:
-                    continue
-                found_nodes.add(neighbor_coordinate)
-                total_cost = neighbor_cost + cost
-                heappush(paths, (total_cost, neighbor_coordinate))
-                if neighbor_coordinate == target:
-                    return total_cost
+    def _lowest_total_risk_jit(cave_map: np.ndarray) -> int:
+        offsets, neighbors = neighbor_table(cave_map.shape)
+        risk_levels = cave_map.reshape(-1).astype(np.int64)
+        cost, _ = bucket_shortest_path_kernel(offsets, neighbors, risk_levels, 0, cave_map.size - 1, False)
+        return cost
 
     def part_1(self) -> int:
-        return Day15._shortest_first(self.data)
+        return self._lowest_total_risk(self.data)
+
+    @strategy(1, "jit")
+    def part_1_jit(self) -> int:
+        if not bucket_shortest_path_kernel.is_compiled:
+            return self.part_1()
+        return Day15._lowest_total_risk_jit(self.data)
 
     @property
     def part_1_solution(self) -> int:
         return 687
 
-    def part_2(self) -> int:
+    def _tiled_map(self) -> np.ndarray:
         width = self.data.shape[0]
         height = self.data.shape[1]
-        big_map = np.empty((5 * width, 5 * height), dtype=int)
-        for i in range(5):
-            for j in range(5):
-                new_map = self.data + i + j
-                new_map[np.where(new_map > 9)] -= 9
+        tiling = self.parameters["tiling"]
+        big_map = np.empty((tiling * width, tiling * height), dtype=int)
+        for i in range(tiling):
+            for j in range(tiling):
+                # risk levels above 9 wrap around to 1
+                new_map = (self.data + (i + j) % 9 - 1) % 9 + 1
                 big_map[i * width : (i + 1) * width, j * height : (j + 1) * height] = new_map
 
-        return Day15._shortest_first(big_map)
+        return big_map
+
+    def part_2(self) -> int:
+        return self._lowest_total_risk(self._tiled_map())
+
+    @strategy(2, "jit")
+    def part_2_jit(self) -> int:
+        if not bucket_shortest_path_kernel.is_compiled:
+            return self.part_2()
+        return Day15._lowest_total_risk_jit(self._tiled_map())
 
     @property
     def part_2_solution(self) -> int:
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    size = max(2, round(100 * math.sqrt(scale)))
+    return ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
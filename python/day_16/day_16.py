@@ -1,45 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from day import Day
 import numpy as np
 
 
-class Packet(ABC):
-    def __init__(self, version: int, type: int) -> None:
-        self._version = version
-        self._type = type
+class LiteralPacket(NamedTuple):
+    version: int
+    number: int
 
     @property
-    @abstractmethod
     def version_sum(self) -> int:
-        pass
+        return self.version
 
     @property
-    @abstractmethod
     def value(self) -> int:
-        pass
-
-    @staticmethod
-    def parse(version: int, bits: str) -> Tuple["Packet", int]:
-        raise NotImplemented
-
-
-class LiteralPacket(Packet):
-    def __init__(self, version: int, number: int) -> None:
-        super().__init__(version, 4)
-        self._number = number
-
-    @property
-    def version_sum(self) -> int:
-        return self._version
-
-    @property
-    def value(self) -> int:
-        return self._number
+        return self.number
 
     @staticmethod
     def parse(version: int, bits: str) -> Tuple["LiteralPacket", int]:
@@ -56,35 +34,35 @@ class LiteralPacket(Packet):
         return (LiteralPacket(version, number), index)
 
 
-class OperatorPacket(Packet):
-    def __init__(self, version: int, type: int, sub_packets: List[Packet]) -> None:
-        super().__init__(version, type)
-        self._sub_packets = sub_packets
+class OperatorPacket(NamedTuple):
+    version: int
+    type: int
+    sub_packets: Sequence["Packet"]
 
     @property
     def version_sum(self) -> int:
-        return self._version + sum(packet.version_sum for packet in self._sub_packets)
+        return self.version + sum(packet.version_sum for packet in self.sub_packets)
 
     @property
     def value(self) -> int:
-        match self._type:
+        match self.type:
             case 0:
-                return sum(packet.value for packet in self._sub_packets)
+                return sum(packet.value for packet in self.sub_packets)
             case 1:
-                return np.prod(list(packet.value for packet in self._sub_packets))
+                return np.prod(list(packet.value for packet in self.sub_packets))
             case 2:
-                return min(packet.value for packet in self._sub_packets)
+                return min(packet.value for packet in self.sub_packets)
             case 3:
-                return max(packet.value for packet in self._sub_packets)
+                return max(packet.value for packet in self.sub_packets)
             case 5:
-                assert len(self._sub_packets) == 2
-                return int(self._sub_packets[0].value > self._sub_packets[1].value)
+                assert len(self.sub_packets) == 2
+                return int(self.sub_packets[0].value > self.sub_packets[1].value)
             case 6:
-                assert len(self._sub_packets) == 2
-                return int(self._sub_packets[0].value < self._sub_packets[1].value)
+                assert len(self.sub_packets) == 2
+                return int(self.sub_packets[0].value < self.sub_packets[1].value)
             case 7:
-                assert len(self._sub_packets) == 2
-                return int(self._sub_packets[0].value == self._sub_packets[1].value)
+                assert len(self.sub_packets) == 2
+                return int(self.sub_packets[0].value == self.sub_packets[1].value)
             case _:
                 assert False
 
@@ -106,7 +84,10 @@ class OperatorPacket(Packet):
             packets.extend(sub_packets)
             index += bits_read
 
-        return (OperatorPacket(version, type, packets), index)
+        return (OperatorPacket(version, type, tuple(packets)), index)
+
+
+Packet = Union[LiteralPacket, OperatorPacket]
 
 
 def parse_packets(bits: str, max_packet_count: Optional[int] = None) -> Tuple[List[Packet], int]:
@@ -133,8 +114,8 @@ def parse_packets(bits: str, max_packet_count: Optional[int] = None) -> Tuple[Li
 
 
 class Day16(Day):
-    def __init__(self) -> None:
-        super().__init__(16)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(16, input_file)
 
     def parse_data(self) -> List[Packet]:
         bits = "".join([f"{int(letter, 16):04b}" for letter in self.raw_data[0]])
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def _literal_packet(rng: Random) -> str:
+    value_bits = "{:b}".format(rng.randrange(2 ** rng.randint(1, 16)))
+    value_bits = value_bits.zfill(4 * math.ceil(len(value_bits) / 4))
+    groups = [value_bits[i : i + 4] for i in range(0, len(value_bits), 4)]
+    return "{:03b}100".format(rng.randrange(8)) + "".join(
+        ("0" if i == len(groups) - 1 else "1") + group for i, group in enumerate(groups)
+    )
+
+
+def _operator_packet(rng: Random, type_id: int, sub_packets: List[str]) -> str:
+    header = "{:03b}{:03b}".format(rng.randrange(8), type_id)
+    content = "".join(sub_packets)
+    if len(content) < 2**15 and rng.random() < 0.5:
+        return header + "0{:015b}".format(len(content)) + content
+    return header + "1{:011b}".format(len(sub_packets)) + content
+
+
+def _generate_packet(rng: Random, packet_count: int, depth: int) -> str:
+    if packet_count <= 1 or depth == 0:
+        return _literal_packet(rng)
+
+    type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    if type_id < 4:
+        sub_packet_count = rng.randint(1, min(packet_count - 1, 5 if type_id == 1 else 2000))
+    else:
+        sub_packet_count = 2
+    # distribute the remaining packets randomly over the sub packets
+    remaining_count = max(packet_count - 1, sub_packet_count)
+    cuts = sorted(rng.sample(range(1, remaining_count), sub_packet_count - 1))
+    sizes = [end - start for start, end in zip([0] + cuts, cuts + [remaining_count])]
+    sub_packets = [_generate_packet(rng, size, depth - 1) for size in sizes]
+    return _operator_packet(rng, type_id, sub_packets)
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    max_depth = min(150, round(15 * math.sqrt(scale)))
+    bits = _generate_packet(rng, max(1, round(300 * scale)), max_depth)
+    bits += "0" * (-len(bits) % 8)
+    return ["".join("{:X}".format(int(bits[i : i + 4], 2)) for i in range(0, len(bits), 4))]
@@ -4,18 +4,47 @@
 import math
 from typing import List, Optional, Tuple
 
-from day import Day
+from day import Day, strategy
+from jit import kernel
+from parsing import integer_table
+
+TARGET_AREA_COLUMNS = ("min_x", "max_x", "min_y", "max_y")
+
+
+@kernel
+def _scan_velocities(
+    min_x: int, max_x: int, min_y: int, max_y: int, x_from: int, x_to: int, y_from: int, y_to: int
+) -> Tuple[int, int]:
+    # the number of initial velocities that hit the target area and the highest point of their trajectories
+    hit_count = 0
+    highest_y = 0
+    for initial_x_velocity in range(x_from, x_to):
+        for initial_y_velocity in range(y_from, y_to):
+            x_velocity = initial_x_velocity
+            y_velocity = initial_y_velocity
+            x_position = 0
+            y_position = 0
+            trajectory_highest_y = 0
+            while x_position <= max_x and y_position >= min_y:
+                x_position += x_velocity
+                y_position += y_velocity
+                x_velocity = max(x_velocity - 1, 0)
+                y_velocity -= 1
+                trajectory_highest_y = max(trajectory_highest_y, y_position)
+                if min_x <= x_position <= max_x and min_y <= y_position <= max_y:
+                    hit_count += 1
+                    highest_y = max(highest_y, trajectory_highest_y)
+                    break
+    return hit_count, highest_y
 
 
 class Day17(Day):
-    def __init__(self) -> None:
-        super().__init__(17)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(17, input_file)
 
     def parse_data(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
-        _, x_part, y_part = self.raw_data[0].split("=")
-        target_x = tuple(int(x) for x in x_part.split(",")[0].split(".."))
-        target_y = tuple(int(y) for y in y_part.split(".."))
-        return target_x, target_y
+        min_x, max_x, min_y, max_y = integer_table(self.input_buffer, TARGET_AREA_COLUMNS)[0].tolist()
+        return (min_x, max_x), (min_y, max_y)
 
     def _trajectory_to_target_area(self, x_velocity: int, y_velocity: int) -> Optional[List[Tuple[int, int]]]:
         assert x_velocity > 0
@@ -42,6 +71,14 @@ class Day17(Day):
                 max_y = max([point[1] for point in trajectory] + [max_y])
         return max_y
 
+    @strategy(1, "jit")
+    def part_1_jit(self) -> int:
+        if not _scan_velocities.is_compiled:
+            return self.part_1()
+        min_x = int((-1 + math.sqrt(1 + 8 * self.data[0][0])) / 2)
+        _, max_y = _scan_velocities(*self.data[0], *self.data[1], min_x, 2 * min_x, 0, 100)
+        return max_y
+
     @property
     def part_1_solution(self) -> int:
         return 4186
@@ -57,6 +94,14 @@ class Day17(Day):
                 trajectory_count += 1
         return trajectory_count
 
+    @strategy(2, "jit")
+    def part_2_jit(self) -> int:
+        if not _scan_velocities.is_compiled:
+            return self.part_2()
+        min_x = int((-1 + math.sqrt(1 + 8 * self.data[0][0])) / 2)
+        hit_count, _ = _scan_velocities(*self.data[0], *self.data[1], min_x, 20 * min_x, -200, 200)
+        return hit_count
+
     @property
     def part_2_solution(self) -> int:
         return 2709
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    min_x = max(1, round(rng.randint(150, 300) * scale))
+    max_x = min_x + max(1, round(rng.randint(20, 40) * scale))
+    max_y = -max(1, round(rng.randint(50, 70) * scale))
+    min_y = max_y - max(1, round(rng.randint(20, 40) * scale))
+    return ["target area: x={}..{}, y={}..{}".format(min_x, max_x, min_y, max_y)]
@@ -9,6 +9,8 @@ from day import Day
 
 
 class SnailfishNumber:
+    __slots__ = ("_left", "_right", "_parent")
+
     def __init__(self, left: Union["SnailfishNumber" , int], right: Union["SnailfishNumber" , int]) -> None:
         self.left = left
         self.right = right
@@ -162,8 +164,17 @@ class SnailfishNumber:
     def __repr__(self) -> str:
         return f"[{self.left},{self.right}]"
 
-    def clone(self) -> "SnailfishNumber":
-        return SnailfishNumber.parse(str(self))
+    @property
+    def pairs(self) -> "Pair":
+        # the number as nested tuples, which can be shared
+        left = self.left if isinstance(self.left, int) else self.left.pairs
+        right = self.right if isinstance(self.right, int) else self.right.pairs
+        return (left, right)
+
+    @staticmethod
+    def from_pairs(pairs: "Pair") -> "SnailfishNumber":
+        left, right = (item if isinstance(item, int) else SnailfishNumber.from_pairs(item) for item in pairs)
+        return SnailfishNumber(left, right)
 
     @staticmethod
     def parse(line: str) -> "SnailfishNumber":
@@ -196,17 +207,22 @@ class SnailfishNumber:
         assert not open_numbers and result is not None
         return result
 
+
+Pair = Tuple[Union["Pair", int], Union["Pair", int]]
+
+
 class Day18(Day):
-    def __init__(self) -> None:
-        super().__init__(18)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(18, input_file)
 
-    def parse_data(self) -> List[SnailfishNumber]:
-        return [SnailfishNumber.parse(line) for line in self.raw_data]
+    def parse_data(self) -> List[Pair]:
+        # reducing changes the numbers in place, the parts build them from the shared pairs
+        return [SnailfishNumber.parse(line).pairs for line in self.raw_data]
 
     def part_1(self) -> int:
-        result = self.data[0].clone()
+        result = SnailfishNumber.from_pairs(self.data[0])
         for i in range(1, len(self.data)):
-            result += self.data[i].clone()
+            result += SnailfishNumber.from_pairs(self.data[i])
         return result.magnitude
 
     @property
@@ -215,10 +231,10 @@ class Day18(Day):
 
     def part_2(self) -> int:
         max_magnitude = 0
-        for a, b in itertools.product(self.data, self.data):
-            if a == b:
-                continue
-            max_magnitude = max(max_magnitude, (a.clone() + b.clone()).magnitude)
+        # ordered pairs of two different entries, by position since equal numbers compare equal as tuples
+        for a, b in itertools.permutations(self.data, 2):
+            sum_number = SnailfishNumber.from_pairs(a) + SnailfishNumber.from_pairs(b)
+            max_magnitude = max(max_magnitude, sum_number.magnitude)
         return max_magnitude
 
     @property
@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def _generate_number(rng: Random, depth: int) -> str:
+    def element() -> str:
+        if depth < 4 and rng.random() < 0.6:
+            return _generate_number(rng, depth + 1)
+        return str(rng.randrange(10))
+
+    return "[{},{}]".format(element(), element())
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    return [_generate_number(rng, 1) for _ in range(max(2, round(100 * scale)))]
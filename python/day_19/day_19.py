@@ -7,17 +7,22 @@ from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
 
 from day import Day
+from parsing import integer_table
+
+BEACON_COLUMNS = ("x", "y", "z")
 
 
 class Scanner:
-    def __init__(self, number: int, beacons: List[np.ndarray]) -> None:
+    __slots__ = ("_number", "_beacons", "_absolute_position", "_relative_beacon_positions")
+
+    def __init__(self, number: int, beacons: np.ndarray) -> None:
         self._number = number
         self._beacons = beacons
         self._absolute_position: Optional[np.ndarray] = None
         self._relative_beacon_positions = self._calculate_relative_beacon_positions()
 
     @property
-    def beacons(self):
+    def beacons(self) -> np.ndarray:
         return self._beacons
 
     @property
@@ -40,25 +45,11 @@ class Scanner:
         return abs(self.absolute_position - other_scanner.absolute_position).sum()
 
     @staticmethod
-    def parse(lines: List[str]) -> Iterator["Scanner"]:
-        current_scanner_number = 0
-        current_beacons = []
-
-        def build_scanner():
-            nonlocal current_scanner_number, current_beacons
-            scanner = Scanner(current_scanner_number, current_beacons)
-            current_scanner_number += 1
-            current_beacons = []
-            return scanner
-
-        for line in lines:
-            if "scanner" in line:
-                continue
-            if not line:
-                yield build_scanner()
-                continue
-            current_beacons.append(np.array([int(coordinate) for coordinate in line.split(",")]))
-        yield build_scanner()
+    def parse_beacons(text: bytes) -> Iterator[np.ndarray]:
+        # blocks of a "--- scanner N ---" header and one beacon per line, separated by blank lines
+        for block in text.strip().split(b"\n\n"):
+            _, _, beacon_lines = block.partition(b"\n")
+            yield integer_table(beacon_lines, BEACON_COLUMNS)
 
     @staticmethod
     def _rotate_coordinate(
@@ -71,7 +62,7 @@ class Scanner:
             modified_coordinate[permutation[2]].item(),
         )
 
-    def try_correlate(self, other: "Scanner") -> bool:
+    def try_correlate(self, other: "Scanner") -> Optional["Scanner"]:
         other_relative_beacon_positions = set(other.relative_beacon_positions.keys())
         for permutation in itertools.permutations(range(3)):
             for sign_tuple in [(1, 1, 1), (1, 1, -1), (1, -1, 1), (1, -1, -1)]:
@@ -98,16 +89,14 @@ class Scanner:
                     different_absolute_positions.add(tuple((cs_other_other_a - cs_other_own_a).tolist()))
 
                 if len(different_absolute_positions) == 1:
-                    self.absolute_position = np.array(different_absolute_positions.pop())
+                    absolute_position = np.array(different_absolute_positions.pop())
                 else:
                     sign *= -1
-                    self.absolute_position = cs_other_other_a + cs_other_own_b
-
-                self._rotate_beacons(sign, permutation)
+                    absolute_position = cs_other_other_a + cs_other_own_b
 
-                return True
+                return self.located(sign, permutation, absolute_position)
 
-        return False
+        return None
 
     def _calculate_relative_beacon_positions(self) -> Dict:
         relative_beacon_positions = {}
@@ -116,46 +105,65 @@ class Scanner:
             relative_beacon_positions[tuple((b - a).tolist())] = (a, b)
         return relative_beacon_positions
 
-    def _rotate_beacons(self, sign: np.ndarray, permutation: Tuple[int, int, int]) -> None:
-        rotated_beacons = []
-        for beacon in self._beacons:
-            rotated_beacons.append(
-                np.array(Scanner._rotate_coordinate(beacon, sign, permutation)) + self.absolute_position
-            )
-        self._beacons = rotated_beacons
-        self._relative_beacon_positions = self._calculate_relative_beacon_positions()
+    def located(
+        self, sign: np.ndarray, permutation: Tuple[int, int, int], absolute_position: np.ndarray
+    ) -> "Scanner":
+        # the parsed scanners are left untouched, locating one creates a rotated and moved copy
+        rotated_beacons = (sign * self._beacons)[:, list(permutation)] + absolute_position
+        scanner = Scanner(self._number, rotated_beacons)
+        scanner.absolute_position = absolute_position
+        return scanner
 
 
 class Day19(Day):
-    def __init__(self) -> None:
-        super().__init__(19)
-
-    def parse_data(self) -> List[Scanner]:
-        return list(Scanner.parse(self.raw_data))
-
-    def _determine_absolute_positions(self) -> None:
-        self.data[0].absolute_position = (0, 0, 0)
-        known_scanners = [self.data[0]]
-
-        for _ in range(len(self.data)):
-            for scanner in self.data:
-                if scanner.has_known_absolute_position:
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(19, input_file)
+        # both parts need the located scanners, they are kept for as long as the parsed data doesn't change
+        self._located_scanners: Optional[Tuple[Tuple[np.ndarray, ...], List[Scanner]]] = None
+
+    def parse_data(self) -> Tuple[np.ndarray, ...]:
+        # the beacons of every scanner, the parts build the scanners from them
+        return tuple(Scanner.parse_beacons(bytes(self.input_buffer)))
+
+    def _locate_scanners(self) -> List[Scanner]:
+        if self._located_scanners is not None and self._located_scanners[0] is self.data:
+            return self._located_scanners[1]
+
+        scanners = [Scanner(number, beacons) for number, beacons in enumerate(self.data)]
+        checkpoint = self.checkpoint("located scanners")
+        # the first scanner defines the coordinate system
+        located_scanners = {0: scanners[0].located(np.ones(3, dtype=int), (0, 1, 2), np.zeros(3, dtype=int))}
+        correlation_attempts = 0
+        resumed_state = checkpoint.load()
+        if resumed_state is not None:
+            located_scanners, correlation_attempts = resumed_state
+        for _ in range(len(scanners)):
+            for index, scanner in enumerate(scanners):
+                if index in located_scanners:
                     continue
 
-                for known_scanner in known_scanners:
-                    if scanner.try_correlate(known_scanner):
-                        known_scanners.append(scanner)
+                for known_scanner in list(located_scanners.values()):
+                    located_scanner = scanner.try_correlate(known_scanner)
+                    correlation_attempts += 1
+                    if located_scanner is not None:
+                        located_scanners[index] = located_scanner
                         break
 
-            if len(known_scanners) == len(self.data):
+                if checkpoint.is_due:
+                    checkpoint.save((located_scanners, correlation_attempts))
+
+            if len(located_scanners) == len(scanners):
                 break
 
-        assert len(known_scanners) == len(self.data), "the absolute position of every scanner was determined"
+        self.count("correlation attempts", correlation_attempts)
+        assert len(located_scanners) == len(scanners), "the absolute position of every scanner was determined"
+        self._located_scanners = (self.data, [located_scanners[index] for index in range(len(scanners))])
+        checkpoint.clear()
+        return self._located_scanners[1]
 
     def part_1(self) -> int:
-        self._determine_absolute_positions()
         absolute_beacon_positions = set()
-        for scanner in self.data:
+        for scanner in self._locate_scanners():
             for beacon in scanner.beacons:
                 absolute_beacon_positions.add(tuple(beacon.tolist()))
 
@@ -166,10 +174,9 @@ class Day19(Day):
         return 332
 
     def part_2(self) -> int:
-        if not all(scanner.has_known_absolute_position for scanner in self.data):
-            self._determine_absolute_positions()
+        located_scanners = self._locate_scanners()
         max_distance = 0
-        for a, b in itertools.product(self.data, self.data):
+        for a, b in itertools.product(located_scanners, located_scanners):
             if a == b:
                 continue
 
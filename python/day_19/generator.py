@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import itertools
+from random import Random
+from typing import List, Tuple
+
+Point = Tuple[int, int, int]
+
+SCANNER_RANGE = 1000
+
+
+def _rotations() -> List[Tuple[Tuple[int, int, int], Point]]:
+    rotations = []
+    for permutation in itertools.permutations(range(3)):
+        inversions = sum(1 for i, j in itertools.combinations(permutation, 2) if i > j)
+        for sign in itertools.product((1, -1), repeat=3):
+            # only proper rotations, no reflections
+            if (-1) ** inversions * sign[0] * sign[1] * sign[2] == 1:
+                rotations.append((permutation, sign))
+    return rotations
+
+
+def _random_point(rng: Random, low: Point, high: Point) -> Point:
+    return tuple(rng.randint(low[axis], high[axis]) for axis in range(3))
+
+
+def _is_in_range(scanner: Point, beacon: Point) -> bool:
+    return all(abs(beacon[axis] - scanner[axis]) <= SCANNER_RANGE for axis in range(3))
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    scanners = [(0, 0, 0)]
+    beacons = set()
+    while len(beacons) < 26:
+        beacons.add(_random_point(rng, (-SCANNER_RANGE,) * 3, (SCANNER_RANGE,) * 3))
+
+    for _ in range(max(2, round(30 * scale)) - 1):
+        parent = rng.choice(scanners)
+        scanner = tuple(parent[axis] + rng.randint(-1100, 1100) for axis in range(3))
+        low = tuple(max(parent[axis], scanner[axis]) - SCANNER_RANGE for axis in range(3))
+        high = tuple(min(parent[axis], scanner[axis]) + SCANNER_RANGE for axis in range(3))
+        # every scanner shares at least 12 beacons with a scanner placed before it
+        while sum(1 for beacon in beacons if _is_in_range(parent, beacon) and _is_in_range(scanner, beacon)) < 12:
+            beacons.add(_random_point(rng, low, high))
+        scanner_low = tuple(coordinate - SCANNER_RANGE for coordinate in scanner)
+        scanner_high = tuple(coordinate + SCANNER_RANGE for coordinate in scanner)
+        while sum(1 for beacon in beacons if _is_in_range(scanner, beacon)) < 26:
+            beacons.add(_random_point(rng, scanner_low, scanner_high))
+        scanners.append(scanner)
+
+    rotations = _rotations()
+    lines = []
+    for number, scanner in enumerate(scanners):
+        permutation, sign = rotations[0] if number == 0 else rng.choice(rotations)
+        lines.append("--- scanner {} ---".format(number))
+        for beacon in beacons:
+            if not _is_in_range(scanner, beacon):
+                continue
+            relative_beacon = [sign[axis] * (beacon[axis] - scanner[axis]) for axis in range(3)]
+            lines.append(",".join(str(relative_beacon[permutation[axis]]) for axis in range(3)))
+        lines.append("")
+    return lines[:-1]
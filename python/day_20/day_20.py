@@ -1,68 +1,103 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple
+from typing import Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from grid import stencil
+from jit import kernel
+
+PIXEL_WEIGHTS = np.array([[256, 128, 64], [32, 16, 8], [4, 2, 1]])
+
+
+@kernel
+def _count_lit_pixels(pixel_lookup: np.ndarray, pixels: np.ndarray, round_count: int) -> int:
+    # the parsed pixels are read-only, numba types them differently than the images created here
+    image = pixels.copy()
+    background_pixel = False
+    for _ in range(round_count):
+        height, width = image.shape
+        new_image = np.empty((height + 2, width + 2), dtype=np.bool_)
+        for x in range(height + 2):
+            for y in range(width + 2):
+                index = 0
+                # the 3x3 neighbourhood of (x - 1, y - 1) in the old image
+                for i in range(x - 2, x + 1):
+                    for j in range(y - 2, y + 1):
+                        if 0 <= i < height and 0 <= j < width:
+                            pixel = image[i, j]
+                        else:
+                            pixel = background_pixel
+                        index = 2 * index + (1 if pixel else 0)
+                new_image[x, y] = pixel_lookup[index]
+        image = new_image
+        background_pixel = pixel_lookup[511 if background_pixel else 0]
+    return int(image.sum())
 
 
 class Day20(Day):
-    def __init__(self) -> None:
-        super().__init__(20)
+    PARAMETERS = {"rounds_part_1": 2, "rounds_part_2": 50}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(20, input_file)
 
-    def parse_data(self) -> Tuple[List[bool], np.ndarray]:
-        pixel_lookup = [character == "#" for character in self.raw_data[0]]
+    def parse_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        pixel_lookup = np.array([character == "#" for character in self.raw_data[0]], dtype=bool)
         pixels = np.array([[character == "#" for character in line] for line in self.raw_data[2:]], dtype=bool)
         return pixel_lookup, pixels
 
-    def _enhance_pixel(self, pixel_bits: np.ndarray) -> bool:
-        assert len(pixel_bits) == 9
-        index = 0
-        for bit in pixel_bits:
-            index *= 2
-            if bit:
-                index += 1
-        return self.pixel_lookup[index]
-
-    def enhance_image(self, pixels: np.ndarray, background_pixel: bool) -> Tuple[np.ndarray, bool]:
-        new_background_pixel = self._enhance_pixel(np.array([background_pixel] * 9))
-        expanded_pixels = np.full((pixels.shape[0] + 4, pixels.shape[1] + 4), background_pixel)
-        expanded_pixels[2 : expanded_pixels.shape[0] - 2, 2 : expanded_pixels.shape[1] - 2] = pixels
-        new_pixels = np.full((pixels.shape[0] + 2, pixels.shape[1] + 2), new_background_pixel)
-
-        for (x, y), _ in np.ndenumerate(new_pixels):
-            pixel_bits = expanded_pixels[x : x + 3, y : y + 3].reshape(-1)
-            new_pixels[x, y] = self._enhance_pixel(pixel_bits)
-
+    @staticmethod
+    def enhance_image(
+        pixel_lookup: np.ndarray, pixels: np.ndarray, background_pixel: bool
+    ) -> Tuple[np.ndarray, bool]:
+        new_background_pixel = pixel_lookup[511 if background_pixel else 0]
+        # the image grows by one pixel on every side, the 3x3 neighbourhoods read as 9 bit lookup indexes
+        expanded_pixels = np.pad(pixels, 1, constant_values=background_pixel)
+        new_pixels = pixel_lookup[stencil(expanded_pixels, PIXEL_WEIGHTS, fill=background_pixel)]
         return new_pixels, new_background_pixel
 
     def part_1(self) -> int:
-        self.pixel_lookup, pixels = self.data
+        pixel_lookup, pixels = self.data
         background_pixel = False
-        output, background_pixel = self.enhance_image(pixels, background_pixel)
-        return len(np.where(self.enhance_image(output, background_pixel)[0] == True)[0])
+        for _ in range(self.parameters["rounds_part_1"]):
+            pixels, background_pixel = self.enhance_image(pixel_lookup, pixels, background_pixel)
+        return len(np.where(pixels == True)[0])
+
+    @strategy(1, "jit")
+    def part_1_jit(self) -> int:
+        if not _count_lit_pixels.is_compiled:
+            return self.part_1()
+        pixel_lookup, pixels = self.data
+        return _count_lit_pixels(pixel_lookup, pixels, self.parameters["rounds_part_1"])
 
     @property
     def part_1_solution(self) -> int:
         return 4964
 
     def part_2(self) -> int:
-        self.pixel_lookup, pixels = self.data
+        pixel_lookup, pixels = self.data
         background_pixel = False
+        # import matplotlib.pyplot as plt
         # target_shape = (200, 200)
-        for _ in range(50):
+        for _ in range(self.parameters["rounds_part_2"]):
             # expanded_pixels = np.full(target_shape, background_pixel)
             # offset = (target_shape[0] - pixels.shape[0]) // 2
             # expanded_pixels[offset : offset + pixels.shape[0], offset : offset + pixels.shape[1]] = pixels
             # plt.imsave(f"foo-{_:02}.png", expanded_pixels)
-            pixels, background_pixel = self.enhance_image(pixels, background_pixel)
+            pixels, background_pixel = self.enhance_image(pixel_lookup, pixels, background_pixel)
 
         # plt.imsave("foo-50.png", pixels)
         return len(np.where(pixels == True)[0])
 
+    @strategy(2, "jit")
+    def part_2_jit(self) -> int:
+        if not _count_lit_pixels.is_compiled:
+            return self.part_2()
+        pixel_lookup, pixels = self.data
+        return _count_lit_pixels(pixel_lookup, pixels, self.parameters["rounds_part_2"])
+
     @property
     def part_2_solution(self) -> int:
         return 13202
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    size = max(1, round(100 * math.sqrt(scale)))
+    # like the puzzle input, the infinite background flips with every enhancement
+    lookup = ["#"] + rng.choices("#.", k=510) + ["."]
+    return ["".join(lookup), ""] + ["".join(rng.choices("#.", k=size)) for _ in range(size)]
@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
-from day import Day
+from day import Day, strategy
+from memo import call_bottom_up, memoize
+
+FIELD_COUNT = 10
+# how many of the 27 universes of three rolls of the Dirac die end up with each sum
+DIRAC_SUMS = {3: 1, 4: 3, 5: 6, 6: 7, 7: 6, 8: 3, 9: 1}
 
 
 class DeterministicDie:
+    __slots__ = ("_roll_count",)
     SIDE_COUNT = 100
 
     def __init__(self):
@@ -24,33 +29,30 @@ class DeterministicDie:
             self._roll_count += 1
 
 
-@dataclass
-class PlayerState:
+class PlayerState(NamedTuple):
     position: int
     score: int
 
-    def __hash__(self) -> int:
-        return hash((self.position, self.score))
-
 
 class Day21(Day):
-    def __init__(self) -> None:
-        super().__init__(21)
+    PARAMETERS = {"target_score_part_1": 1000, "target_score_part_2": 21}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(21, input_file)
 
     def parse_data(self) -> List[int]:
         return [int(line.split(": ")[1]) - 1 for line in self.raw_data]
 
     def part_1(self) -> int:
-        player_positions = self.data[:]
+        player_positions = list(self.data)
         scores = [0] * len(player_positions)
         die = DeterministicDie()
-        field_count = 10
         while True:
             for i, position in enumerate(player_positions):
                 dice_count = die.roll() + die.roll() + die.roll()
-                player_positions[i] = (position + dice_count) % field_count
+                player_positions[i] = (position + dice_count) % FIELD_COUNT
                 scores[i] += player_positions[i] + 1
-                if scores[i] >= 1000:
+                if scores[i] >= self.parameters["target_score_part_1"]:
                     return scores[(i + 1) % 2] * die.roll_count
 
     @property
@@ -58,18 +60,17 @@ class Day21(Day):
         return 513936
 
     def part_2(self) -> int:
-        field_count = 10
+        target_score = self.parameters["target_score_part_2"]
         universes = {tuple(PlayerState(position, 0) for position in self.data): 1}
-        dice_sums = {3: 1, 4: 3, 5: 6, 6: 7, 7: 6, 8: 3, 9: 1}
         universe_win_counts = [0] * len(self.data)
         while universes:
             new_universes = {}
             for universe, universe_count in universes.items():
                 # play player 1
-                for dice_sum, count in dice_sums.items():
-                    position = (universe[0].position + dice_sum) % field_count
+                for dice_sum, count in DIRAC_SUMS.items():
+                    position = (universe[0].position + dice_sum) % FIELD_COUNT
                     score = universe[0].score + position + 1
-                    if score >= 21:
+                    if score >= target_score:
                         universe_win_counts[0] += count * universe_count
                         continue
                     new_universe = (PlayerState(position, score), universe[1])
@@ -78,13 +79,14 @@ class Day21(Day):
                     new_universes[new_universe] += count * universe_count
 
             universes = new_universes
+            self.count("universe states", len(universes))
             new_universes = {}
             for universe, universe_count in universes.items():
                 # play player 2
-                for dice_sum, count in dice_sums.items():
-                    position = (universe[1].position + dice_sum) % field_count
+                for dice_sum, count in DIRAC_SUMS.items():
+                    position = (universe[1].position + dice_sum) % FIELD_COUNT
                     score = universe[1].score + position + 1
-                    if score >= 21:
+                    if score >= target_score:
                         universe_win_counts[1] += count * universe_count
                         continue
                     new_universe = (universe[0], PlayerState(position, score))
@@ -92,9 +94,43 @@ class Day21(Day):
                         new_universes[new_universe] = 0
                     new_universes[new_universe] += count * universe_count
             universes = new_universes
+            self.count("universe states", len(universes))
 
         return max(universe_win_counts)
 
+    @strategy(2, "memo")
+    def part_2_memo(self) -> int:
+        target_score = self.parameters["target_score_part_2"]
+
+        # the universes in which the player about to move and the other player win, many games reach the same state
+        @memoize()
+        def win_counts(position: int, score: int, other_position: int, other_score: int) -> Tuple[int, int]:
+            player_wins = 0
+            other_player_wins = 0
+            for dice_sum, count in DIRAC_SUMS.items():
+                new_position = (position + dice_sum) % FIELD_COUNT
+                new_score = score + new_position + 1
+                if new_score >= target_score:
+                    player_wins += count
+                    continue
+                other_wins, wins = win_counts(other_position, other_score, new_position, new_score)
+                player_wins += count * wins
+                other_player_wins += count * other_wins
+            return player_wins, other_player_wins
+
+        # the states after the next move of the unfinished games, games get longer with the target score
+        def next_states(
+            position: int, score: int, other_position: int, other_score: int
+        ) -> Iterator[Tuple[int, int, int, int]]:
+            for dice_sum in DIRAC_SUMS:
+                new_position = (position + dice_sum) % FIELD_COUNT
+                if score + new_position + 1 < target_score:
+                    yield other_position, other_score, new_position, score + new_position + 1
+
+        result = max(call_bottom_up(win_counts, (self.data[0], 0, self.data[1], 0), next_states))
+        win_counts.record(self.count, "game states")
+        return result
+
     @property
     def part_2_solution(self) -> int:
         return 105619718613031
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    # the game is independent of the input size, the scale only matters for the thresholds
+    return ["Player {} starting position: {}".format(player, rng.randint(1, 10)) for player in (1, 2)]
@@ -1,17 +1,26 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import re
 from typing import List, Optional, Tuple
 
 import numpy as np
 
-from day import Day
+from day import Day, strategy
+from parsing import integer_table
+
+CUBOID_COLUMNS = ("min_x", "max_x", "min_y", "max_y", "min_z", "max_z")
+STATE_PATTERN = re.compile(rb"^(on|off) ", re.MULTILINE)
 
 Index = Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]
 Instruction = Tuple[int, Index]
+# merging the signed cubes of the array strategy only pays off for larger arrays
+MIN_MERGED_COUNT = 1024
 
 
 class Cube:
+    __slots__ = ("min_x", "max_x", "min_y", "max_y", "min_z", "max_z")
+
     def __init__(self, min_x: int, max_x: int, min_y: int, max_y: int, min_z: int, max_z: int) -> None:
         self.min_x = min_x
         self.max_x = max_x
@@ -84,21 +93,17 @@ class Cube:
 
 
 class Day22(Day):
-    def __init__(self) -> None:
-        super().__init__(22)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(22, input_file)
 
     def parse_data(self) -> List[Instruction]:
-        def parse_line(line: str) -> Instruction:
-            state = int(line.startswith("on "))
-            split = line[line.index(" ") + 1 :].split(",")
-
-            def parse_coordinate(coordinate) -> Tuple[int, int]:
-                min_c, max_c = coordinate[coordinate.index("=") + 1 :].split("..")
-                return int(min_c), int(max_c)
-
-            return state, tuple(parse_coordinate(coordinate) for coordinate in split)
-
-        return [parse_line(line) for line in self.raw_data]
+        states = STATE_PATTERN.findall(self.input_buffer)
+        cuboids = integer_table(self.input_buffer, CUBOID_COLUMNS).tolist()
+        assert len(states) == len(cuboids), "every cuboid is switched on or off"
+        return [
+            (int(state == b"on"), ((min_x, max_x), (min_y, max_y), (min_z, max_z)))
+            for state, (min_x, max_x, min_y, max_y, min_z, max_z) in zip(states, cuboids)
+        ]
 
     def part_1(self) -> int:
         reactor = np.full((100, 100, 100), 0, dtype=np.uint8)
@@ -112,8 +117,10 @@ class Day22(Day):
         return 583641
 
     def part_2(self) -> int:
-        cubes = []
-        for i, (state, (x, y, z)) in enumerate(self.data):
+        checkpoint = self.checkpoint("part 2")
+        # the number of instructions applied so far, the cubes that are on and the fragment counter
+        start_index, cubes, fragment_count = checkpoint.load() or (0, [], 0)
+        for i, (state, (x, y, z)) in enumerate(self.data[start_index:], start_index):
             current_cube = Cube(*x, *y, *z)
             if state:
                 current_cubes = [current_cube]
@@ -123,6 +130,7 @@ class Day22(Day):
                         remainder = cube.get_remainder(current_cube)
                         if remainder is None:
                             continue
+                        fragment_count += len(remainder)
                         current_cubes.extend(remainder)
                         break
                     else:
@@ -134,11 +142,53 @@ class Day22(Day):
                     if remainder is None:
                         new_cubes.append(cube)
                         continue
+                    fragment_count += len(remainder)
                     new_cubes.extend(remainder)
                 cubes = new_cubes
 
+            if checkpoint.is_due:
+                checkpoint.save((i + 1, cubes, fragment_count))
+
+        checkpoint.clear()
+        self.count("cube fragments", fragment_count)
+        self.count("cubes", len(cubes))
         return sum(cube.size for cube in cubes)
 
+    @strategy(2, "arrays")
+    def part_2_arrays(self) -> int:
+        # inclusion-exclusion on one array of cube bounds: every instruction adds the intersections with all cubes so
+        # far with the opposite sign, which cancels the overlap, and "on" adds the new cube itself
+        bounds = np.empty((0, 6), dtype=np.int64)
+        signs = np.empty(0, dtype=np.int64)
+        merged_count = MIN_MERGED_COUNT
+        for state, (x, y, z) in self.data:
+            cube = np.array(x + y + z, dtype=np.int64)
+            lows = np.maximum(bounds[:, 0::2], cube[0::2])
+            highs = np.minimum(bounds[:, 1::2], cube[1::2])
+            overlaps = (lows <= highs).all(axis=1)
+            intersections = np.empty((np.count_nonzero(overlaps), 6), dtype=np.int64)
+            intersections[:, 0::2] = lows[overlaps]
+            intersections[:, 1::2] = highs[overlaps]
+            new_bounds = [bounds, intersections]
+            new_signs = [signs, -signs[overlaps]]
+            if state:
+                new_bounds.append(cube[np.newaxis])
+                new_signs.append(np.ones(1, dtype=np.int64))
+            bounds = np.concatenate(new_bounds)
+            signs = np.concatenate(new_signs)
+
+            # the same cube shows up many times, summing up their signs keeps the arrays small
+            if len(bounds) > 2 * merged_count:
+                bounds, indices = np.unique(bounds, axis=0, return_inverse=True)
+                signs = np.bincount(indices.reshape(-1), signs, len(bounds)).astype(np.int64)
+                bounds = bounds[signs != 0]
+                signs = signs[signs != 0]
+                merged_count = max(len(bounds), MIN_MERGED_COUNT)
+
+        self.count("cubes", len(bounds))
+        sizes = np.prod(bounds[:, 1::2] - bounds[:, 0::2] + 1, axis=1)
+        return int((signs * sizes).sum())
+
     @property
     def part_2_solution(self) -> int:
         return 1182153534186233
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def _generate_step(rng: Random, state: str, min_coordinate: int, max_coordinate: int, max_size: int) -> str:
+    ranges = []
+    for axis in "xyz":
+        start = rng.randint(min_coordinate, max_coordinate - 1)
+        end = min(start + rng.randint(1, max_size), max_coordinate)
+        ranges.append("{}={}..{}".format(axis, start, end))
+    return "{} {}".format(state, ",".join(ranges))
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    # the initialization procedure covering -50..50 for part 1 is followed by the full reboot steps
+    steps = [
+        _generate_step(rng, "on" if i < 10 or rng.random() < 0.75 else "off", -50, 50, 50) for i in range(20)
+    ]
+    steps.extend(
+        _generate_step(rng, "on" if rng.random() < 0.5 else "off", -100000, 100000, 40000)
+        for _ in range(max(0, round(400 * scale)))
+    )
+    return steps
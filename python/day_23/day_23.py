@@ -1,291 +1,120 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from enum import IntEnum
-from typing import Dict, List, Optional, Tuple
-
-import numpy as np
+from typing import Iterator, Optional, Tuple
 
 from day import Day
-
-
-class AmphipodType(IntEnum):
-    A = 0
-    B = 1
-    C = 2
-    D = 3
-
-    def __repr__(self) -> str:
-        return self.name
-
-
-class Amphipod:
-    _created_amphipod_types = set()
-
-    def __init__(self, amphipod_type: AmphipodType) -> None:
-        self.amphipod_type = amphipod_type
-        self.name = (
-            self.amphipod_type.name
-            if amphipod_type in Amphipod._created_amphipod_types
-            else self.amphipod_type.name.lower()
-        )
-        Amphipod._created_amphipod_types.add(amphipod_type)
-
-    def __repr__(self) -> str:
-        return self.name
-
-
-class Map:
-    def __init__(self):
-        self.spots_left: List[Optional[Amphipod]] = [None, None]
-        self.spots_right: List[Optional[Amphipod]] = [None, None]
-        self.spots_middle: List[Optional[Amphipod]] = [None, None, None]
-        self.rooms: List[List[Optional[Amphipod]]] = [
-            [None, None],
-            [None, None],
-            [None, None],
-            [None, None],
-        ]
-
-    def all_amphipods(self) -> List[Amphipod]:
-        return list(
-            filter(
-                None,
-                self.spots_left
-                + self.spots_middle
-                + self.spots_right
-                + [item for sublist in self.rooms for item in sublist],
-            )
-        )
-
-    def find_amphipod_in_room(self, amphipod: Amphipod) -> Optional[Tuple[int, int]]:
-        for i, room in enumerate(self.rooms):
-            if amphipod in room:
-                return (i, room.index(amphipod))
-        return None
-
-    def amphipods_for_type(self, amphipod_type: AmphipodType) -> List[Amphipod]:
-        result = []
-        for room in self.rooms:
-            for amphipod in room:
-                if amphipod_type == amphipod.amphipod_type:
-                    result.append(amphipod)
-        return result
-
-    def collisions_for_type(self, amphipod_type: AmphipodType) -> Dict[Amphipod, List[Amphipod]]:
-        amphipods = self.amphipods_for_type(amphipod_type)
-        return {amphipod: self.collisions_for_amphipod(amphipod) for amphipod in amphipods}
-
-    def collisions_for_amphipod(self, amphipod: Amphipod) -> List[Amphipod]:
-        room_location = self.find_amphipod_in_room(amphipod)
-        if room_location is not None:
-            room_index, position = room_location
-            # collisions in target room
-            collisions = [
-                collision
-                for collision in filter(None, self.rooms[amphipod.amphipod_type.value])
-                if collision.amphipod_type != amphipod.amphipod_type
-            ]
-            # collisions in hallway
-            collisions.extend(
-                filter(
-                    None,
-                    self.spots_middle[
-                        min(room_index, amphipod.amphipod_type.value) : max(room_index, amphipod.amphipod_type.value)
-                    ],
-                )
-            )
-            assert amphipod.amphipod_type not in [collision.amphipod_type for collision in collisions]
-            # collision in own room
-            if position == 0 and self.rooms[room_index][1] is not None:
-                collisions.append(self.rooms[room_index][1])
-            return collisions
-
-        # collisions in target room
-        collisions = [
-            collision
-            for collision in filter(None, self.rooms[amphipod.amphipod_type.value])
-            if collision.amphipod_type != amphipod.amphipod_type
-        ]
-        # # collisions in hallway
-        # collisions.extend(
-        #     filter(
-        #         None,
-        #         self.spots_middle[
-        #             min(room_index, amphipod.amphipod_type.value) : max(
-        #                 room_index, amphipod.amphipod_type.value
-        #             )
-        #         ],
-        #     )
-        # )
-        # raise NotImplementedError()
-        return []
-
-    def _remove_amphipod(self, amphipod: Amphipod) -> None:
-        for room in self.rooms:
-            for i, current_amphipod in enumerate(room):
-                if current_amphipod == amphipod:
-                    room[i] = None
-                    return
-
-        for i, current_amphipod in enumerate(self.spots_left):
-            if current_amphipod == amphipod:
-                self.spots_left[i] = None
-                return
-
-        for i, current_amphipod in enumerate(self.spots_middle):
-            if current_amphipod == amphipod:
-                self.spots_middle[i] = None
-                return
-
-        for i, current_amphipod in enumerate(self.spots_right):
-            if current_amphipod == amphipod:
-                self.spots_right[i] = None
-                return
-
-        assert False
-
-    def can_move_amphipod_to_target(self, amphipod: Amphipod) -> bool:
-        bottom_spot_in_target = self.rooms[amphipod.amphipod_type.value][0]
-        return (
-            not self.collisions_for_amphipod(amphipod)
-            and amphipod not in self.rooms[amphipod.amphipod_type.value]
-            and (bottom_spot_in_target is None or bottom_spot_in_target.amphipod_type == amphipod.amphipod_type)
-        )
-
-    def move_amphipod_to_target_or_leftmost_spot(self, amphipod: Amphipod) -> int:
-        if self.can_move_amphipod_to_target(amphipod):
-            for i, spot in enumerate(self.rooms[amphipod.amphipod_type.value]):
-                if spot is None:
-                    room_location = self.find_amphipod_in_room(amphipod)
-                    if room_location is None:
-                        distance_exit = 0
-                        if amphipod in self.spots_left:
-                            distance_hall = 1 - self.spots_left.index(amphipod) + 1 + 2 * amphipod.amphipod_type.value
-                        elif amphipod in self.spots_right:
-                            distance_hall = (
-                                1 - self.spots_right.index(amphipod) + 1 + 2 * (3 - amphipod.amphipod_type.value)
-                            )
-                        elif amphipod in self.spots_middle:
-                            dx = amphipod.amphipod_type.value - self.spots_middle.index(amphipod)
-                            if dx >= 0:
-                                distance_hall = abs(dx * 2 - 1)
-                            else:
-                                distance_hall = -dx * 2 + 1
-                        else:
-                            assert False
-                    else:
-                        distance_exit = 2 - room_location[1]
-                        distance_hall = 1 + 2 * abs(amphipod.amphipod_type.value - room_location[0])
-                    distance_enter = 2 - i
-                    distance = distance_exit + distance_hall + distance_enter
-                    self._remove_amphipod(amphipod)
-                    self.rooms[amphipod.amphipod_type.value][i] = amphipod
-                    return distance * 10**amphipod.amphipod_type.value
-            assert False
-
-        # we can't move to the target room, move to the leftmost free spot
-        self._remove_amphipod(amphipod)
-        for i, spot in enumerate(self.spots_left):
-            if spot is None:
-                self.spots_left[i] = amphipod
-                return 1
-
-        for i, spot in enumerate(self.spots_middle):
-            if spot is None:
-                self.spots_middle[i] = amphipod
-                return 1
-
-        for i, spot in enumerate(self.spots_right):
-            if spot is None:
-                self.spots_right[i] = amphipod
-                return 1
-
-        assert False
-
-    def __repr__(self) -> str:
-        def spot(spot: Optional[Amphipod]) -> str:
-            return " " if spot is None else spot.name
-
-        return "\n".join(
-            [
-                "#############",
-                f"#{spot(self.spots_left[0])}{spot(self.spots_left[1])}.{spot(self.spots_middle[0])}.{spot(self.spots_middle[1])}.{spot(self.spots_middle[2])}.{spot(self.spots_right[1])}{spot(self.spots_right[0])}#",
-                f"###{spot(self.rooms[0][1])}#{spot(self.rooms[1][1])}#{spot(self.rooms[2][1])}#{spot(self.rooms[3][1])}###",
-                f"  #{spot(self.rooms[0][0])}#{spot(self.rooms[1][0])}#{spot(self.rooms[2][0])}#{spot(self.rooms[3][0])}#",
-                "  #########",
-            ]
-        )
+from search import shortest_path
+
+HALLWAY_LENGTH = 11
+# hallway positions in front of the rooms, amphipods never stop there
+DOORS = (2, 4, 6, 8)
+STOPS = tuple(position for position in range(HALLWAY_LENGTH) if position not in DOORS)
+ENERGIES = (1, 10, 100, 1000)
+# the additional lines that unfold the diagram for part 2
+FOLDED_LINES = ("  #D#C#B#A#", "  #D#B#A#C#")
+
+
+class Burrow:
+    # a state is a bytes object, the hallway followed by the rooms from top to bottom,
+    # 0 is an empty spot and 1 to 4 are the amphipods A to D
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.goal = bytes(HALLWAY_LENGTH) + b"".join(bytes([amphipod] * depth) for amphipod in range(1, 5))
+
+    def room(self, state: bytes, room_index: int) -> bytes:
+        start = HALLWAY_LENGTH + room_index * self.depth
+        return state[start : start + self.depth]
+
+    def moves(self, state: bytes) -> Iterator[Tuple[bytes, int]]:
+        # from the hallway straight into the own room, if it only holds amphipods of the right type
+        for position in STOPS:
+            amphipod = state[position]
+            if not amphipod:
+                continue
+            room = self.room(state, amphipod - 1)
+            if any(occupant not in (0, amphipod) for occupant in room):
+                continue
+            door = DOORS[amphipod - 1]
+            step = 1 if door > position else -1
+            if any(state[hallway_position] for hallway_position in range(position + step, door, step)):
+                continue
+
+            free_count = room.count(0)
+            new_state = bytearray(state)
+            new_state[position] = 0
+            new_state[HALLWAY_LENGTH + (amphipod - 1) * self.depth + free_count - 1] = amphipod
+            yield bytes(new_state), (abs(door - position) + free_count) * ENERGIES[amphipod - 1]
+
+        # from the top of a room that holds wrong amphipods to any reachable stop in the hallway
+        for room_index, door in enumerate(DOORS):
+            room = self.room(state, room_index)
+            if all(occupant in (0, room_index + 1) for occupant in room):
+                continue
+            top = room.count(0)
+            amphipod = room[top]
+            for step in (-1, 1):
+                position = door + step
+                while 0 <= position < HALLWAY_LENGTH and not state[position]:
+                    if position not in DOORS:
+                        new_state = bytearray(state)
+                        new_state[position] = amphipod
+                        new_state[HALLWAY_LENGTH + room_index * self.depth + top] = 0
+                        yield bytes(new_state), (top + 1 + abs(position - door)) * ENERGIES[amphipod - 1]
+                    position += step
+
+    def minimum_energy(self, state: bytes) -> int:
+        # every amphipod that isn't home yet has to walk to its room at least, ignoring all others
+        energy = 0
+        for position in STOPS:
+            amphipod = state[position]
+            if amphipod:
+                energy += (abs(position - DOORS[amphipod - 1]) + 1) * ENERGIES[amphipod - 1]
+        for room_index, door in enumerate(DOORS):
+            room = self.room(state, room_index)
+            for depth, amphipod in enumerate(room):
+                if not amphipod or all(occupant == room_index + 1 for occupant in room[depth:]):
+                    continue
+                # amphipods blocking others in their own room have to step aside
+                hallway_distance = max(abs(door - DOORS[amphipod - 1]), 2)
+                energy += (depth + 1 + hallway_distance + 1) * ENERGIES[amphipod - 1]
+        return energy
 
 
 class Day23(Day):
-    def __init__(self) -> None:
-        super().__init__(23)
-
-    def parse_data(self) -> Map:
-        world = Map()
-        for i, character in enumerate(self.raw_data[2].replace("#", "").strip()):
-            world.rooms[i][1] = Amphipod(AmphipodType[character])
-        for i, character in enumerate(self.raw_data[3].replace("#", "").strip()):
-            world.rooms[i][0] = Amphipod(AmphipodType[character])
-        return world
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(23, input_file)
+
+    def parse_data(self) -> Tuple[str, ...]:
+        return tuple(self.raw_data)
+
+    @staticmethod
+    def _parse_state(lines: Tuple[str, ...]) -> Tuple[Burrow, bytes]:
+        room_lines = [line.replace("#", "").strip() for line in lines[2:-1]]
+        burrow = Burrow(len(room_lines))
+        rooms = [[" ABCD".index(line[room_index]) for line in room_lines] for room_index in range(len(DOORS))]
+        return burrow, bytes(HALLWAY_LENGTH) + b"".join(bytes(room) for room in rooms)
+
+    def _organize(self, lines: Tuple[str, ...], checkpoint_name: str) -> int:
+        burrow, state = Day23._parse_state(lines)
+        checkpoint = self.checkpoint(checkpoint_name)
+        result = shortest_path(
+            state, burrow.moves, lambda state: state == burrow.goal, burrow.minimum_energy, checkpoint=checkpoint
+        )
+        checkpoint.clear()
+        self.count("expanded states", result.expanded_count)
+        return result.cost
 
     def part_1(self) -> int:
-        print(self.data)
-
-        move_order = []
-        amphipods_to_move = self.data.amphipods_for_type(AmphipodType.D)
-        while True:
-            move_out_of_the_way = set()
-            for amphipod in amphipods_to_move:
-                move_out_of_the_way.update(
-                    collision
-                    for collision in self.data.collisions_for_amphipod(amphipod)
-                    if collision.amphipod_type < amphipod.amphipod_type
-                )
-            if not move_out_of_the_way:
-                break
-            move_order.append(move_out_of_the_way)
-            amphipods_to_move = move_out_of_the_way
-        print(move_order)
-
-        cost = 0
-        for order in move_order[::-1]:
-            print(order)
-            while order:
-                for amphipod in order:
-                    if order.intersection(self.data.collisions_for_amphipod(amphipod)):
-                        continue
-
-                    print("Moving", amphipod, "out of the way")
-                    cost += self.data.move_amphipod_to_target_or_leftmost_spot(amphipod)
-                    print(self.data)
-                    order.remove(amphipod)
-                    print(order)
-                    break
-
-        moved = True
-        while moved:
-            moved = False
-            for amphipod in self.data.all_amphipods():
-                if not self.data.can_move_amphipod_to_target(amphipod):
-                    continue
-                new_cost = self.data.move_amphipod_to_target_or_leftmost_spot(amphipod)
-                if new_cost:
-                    print("Moving", amphipod, "to target")
-                    cost += new_cost
-                    moved = True
-                    print(self.data)
-
-        return cost
+        return self._organize(self.data, "part 1")
 
     @property
     def part_1_solution(self) -> int:
-        return None
+        return 15516
 
     def part_2(self) -> int:
-        pass
+        return self._organize(self.data[:3] + FOLDED_LINES + self.data[3:], "part 2")
 
     @property
     def part_2_solution(self) -> int:
-        return None
+        return 45272
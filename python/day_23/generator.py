@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    # the burrow has a fixed size, the scale is ignored
+    amphipods = list("AABBCCDD")
+    rng.shuffle(amphipods)
+    return [
+        "#############",
+        "#...........#",
+        "###{}#{}#{}#{}###".format(*amphipods[:4]),
+        "  #{}#{}#{}#{}#".format(*amphipods[4:]),
+        "  #########",
+    ]
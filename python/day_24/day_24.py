@@ -1,28 +1,91 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import numpy as np
+from typing import Optional, Sequence, Tuple
 
 from day import Day
+from memo import memoize
+
+# the program repeats one block of instructions per digit, only three of its arguments change
+BLOCK_LENGTH = 18
+PARAMETER_LINES = {4: "div z ", 5: "add x ", 15: "add y "}
+
+Block = Tuple[int, int, int]
 
 
 class Day24(Day):
-    def __init__(self) -> None:
-        super().__init__(24)
+    # the search remembers the states without a valid model number, at most this many
+    PARAMETERS = {"memo_capacity": 1 << 20}
+
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(24, input_file)
+
+    def parse_data(self) -> Tuple[Block, ...]:
+        assert len(self.raw_data) % BLOCK_LENGTH == 0, "The program consists of blocks of {} instructions".format(
+            BLOCK_LENGTH
+        )
+        blocks = []
+        for start in range(0, len(self.raw_data), BLOCK_LENGTH):
+            lines = self.raw_data[start : start + BLOCK_LENGTH]
+            assert lines[0] == "inp w", "Every block reads a digit first"
+            parameters = []
+            for index, prefix in PARAMETER_LINES.items():
+                assert lines[index].startswith(prefix), "Unexpected instruction {}".format(lines[index])
+                parameters.append(int(lines[index][len(prefix) :]))
+            divisor, x_offset, y_offset = parameters
+            assert divisor in (1, 26), "Unexpected divisor {}".format(divisor)
+            blocks.append((divisor, x_offset, y_offset))
+        return tuple(blocks)
+
+    def _find_model_number(self, digits: Sequence[int], checkpoint_name: str) -> int:
+        # z is a stack of base 26 digits, a block pushes w + y_offset unless w equals the top plus x_offset, and
+        # blocks dividing by 26 drop the top; only z = 0 at the end is valid, so the stack can't hold more entries
+        # than the remaining blocks drop minus those that push for sure (x_offset > 9 never matches a digit)
+        blocks = self.data
+        stack_limits = [
+            sum((divisor == 26) - (divisor == 1 and x_offset > 9) for divisor, x_offset, _ in blocks[index:])
+            for index in range(len(blocks) + 1)
+        ]
+
+        # the remaining digits of the first model number in the given digit order, or None
+        @memoize(self.parameters["memo_capacity"])
+        def remaining_digits(index: int, z: int) -> Optional[int]:
+            # the memo holds the finished part of the search, resuming fills it in again
+            if checkpoint.is_due:
+                checkpoint.save(remaining_digits.items())
+            if index == len(blocks):
+                return 0 if z == 0 else None
+            if z >= 26 ** stack_limits[index]:
+                return None
+
+            divisor, x_offset, y_offset = blocks[index]
+            for digit in digits:
+                next_z = z // divisor
+                if z % 26 + x_offset != digit:
+                    next_z = 26 * next_z + digit + y_offset
+                rest = remaining_digits(index + 1, next_z)
+                if rest is not None:
+                    return digit * 10 ** (len(blocks) - index - 1) + rest
+            return None
 
-    def parse_data(self) -> np.ndarray:
-        return np.array(self.raw_data)
+        checkpoint = self.checkpoint(checkpoint_name)
+        remaining_digits.update(checkpoint.load() or [])
+        model_number = remaining_digits(0, 0)
+        checkpoint.clear()
+        remaining_digits.record(self.count, "search states")
+        assert model_number is not None, "There is no valid model number"
+        return model_number
 
     def part_1(self) -> int:
-        pass
+        return self._find_model_number(range(9, 0, -1), "part 1")
 
     @property
     def part_1_solution(self) -> int:
-        return None
+        return 92793949489995
 
     def part_2(self) -> int:
-        pass
+        return self._find_model_number(range(1, 10), "part 2")
 
     @property
     def part_2_solution(self) -> int:
-        return None
+        return 51131616112781
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from random import Random
+from typing import List
+
+BLOCK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {x_offset}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {y_offset}
+mul y x
+add z y"""
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    # every digit pushes onto or pops from a base 26 stack in z, a model number exists if pushes and pops match
+    pair_count = 7 * max(1, round(scale))
+    blocks = []
+    open_y_offsets = []
+    pushes_left = pair_count
+    while pushes_left or open_y_offsets:
+        if pushes_left and (not open_y_offsets or rng.random() < 0.5):
+            y_offset = rng.randint(1, 16)
+            blocks.append(BLOCK.format(divisor=1, x_offset=rng.randint(10, 15), y_offset=y_offset))
+            open_y_offsets.append(y_offset)
+            pushes_left -= 1
+        else:
+            # the popped digit differs by at most 8 from the pushed one
+            digit_difference = rng.randint(-8, min(8, open_y_offsets[-1]))
+            x_offset = digit_difference - open_y_offsets.pop()
+            blocks.append(BLOCK.format(divisor=26, x_offset=x_offset, y_offset=rng.randint(1, 16)))
+    return "\n".join(blocks).split("\n")
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from random import Random
+from typing import List
+
+
+def generate(scale: float, rng: Random) -> List[str]:
+    height = max(1, round(137 * math.sqrt(scale)))
+    width = max(1, round(139 * math.sqrt(scale)))
+    return ["".join(rng.choices(">v.", weights=[3, 3, 4], k=width)) for _ in range(height)]
@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 import numpy as np
 
 from day import Day
 
 
 class DayXXX(Day):
-    def __init__(self) -> None:
-        super().__init__(XXX)
+    def __init__(self, input_file: Optional[str] = None) -> None:
+        super().__init__(XXX, input_file)
 
     def parse_data(self) -> np.ndarray:
         return np.array(self.raw_data)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from importlib import import_module
+from random import Random
+
+GENERATED_DIRECTORY = "generated"
+
+
+def generated_input_file(day_number: int, scale: float, seed: int = 0) -> str:
+    directory = os.path.join("day_{:02d}".format(day_number), GENERATED_DIRECTORY)
+    file_name = os.path.join(directory, "scale_{:g}_seed_{}".format(scale, seed))
+    if os.path.exists(file_name):
+        return file_name
+
+    generator = import_module("day_{:02d}.generator".format(day_number))
+    lines = generator.generate(scale, Random(seed))
+    os.makedirs(directory, exist_ok=True)
+    # write to a temporary file first so an interrupted generation doesn't leave a truncated input behind
+    with open(file_name + ".tmp", "w") as fh:
+        fh.write("\n".join(lines) + "\n")
+    os.replace(file_name + ".tmp", file_name)
+    return file_name
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+# the order in which neighbours are listed, up, left, down, right and then the diagonals
+ORTHOGONAL_DIRECTIONS = ((-1, 0), (0, -1), (1, 0), (0, 1))
+ALL_DIRECTIONS = ORTHOGONAL_DIRECTIONS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+Shape = Tuple[int, int]
+
+# the tables of the few grid shapes in use at a time are kept, those of large grids must not stay around for the
+# whole process (or server)
+TABLE_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def neighbor_table(shape: Shape, diagonal: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    # CSR layout, the neighbours of the flat (row-major) cell i are indices[offsets[i] : offsets[i + 1]]
+    directions = ALL_DIRECTIONS if diagonal else ORTHOGONAL_DIRECTIONS
+    rows, columns = np.indices(shape).reshape(2, -1)
+    targets = np.empty((rows.size, len(directions)), dtype=np.int64)
+    is_valid = np.empty((rows.size, len(directions)), dtype=bool)
+    for k, (dx, dy) in enumerate(directions):
+        target_rows = rows + dx
+        target_columns = columns + dy
+        is_valid[:, k] = (target_rows >= 0) & (target_rows < shape[0]) & (target_columns >= 0)
+        is_valid[:, k] &= target_columns < shape[1]
+        targets[:, k] = target_rows * shape[1] + target_columns
+
+    offsets = np.zeros(rows.size + 1, dtype=np.int64)
+    np.cumsum(is_valid.sum(axis=1), out=offsets[1:])
+    indices = targets[is_valid]
+    offsets.flags.writeable = False
+    indices.flags.writeable = False
+    return offsets, indices
+
+
+def neighbor_lists(shape: Shape, diagonal: bool = False) -> Tuple[List[int], List[int]]:
+    # the same table as plain lists, indexing those is faster in Python loops; they take about five times the
+    # memory of the arrays, so they aren't cached and only live as long as the caller keeps them
+    offsets, indices = neighbor_table(shape, diagonal)
+    return offsets.tolist(), indices.tolist()
+
+
+def shift(values: np.ndarray, dx: int, dy: int, fill: int = 0) -> np.ndarray:
+    # shifted[x, y] = values[x + dx, y + dy], cells outside of the grid are fill
+    shifted = np.full_like(values, fill)
+    height, width = values.shape
+    shifted[max(-dx, 0) : height - max(dx, 0), max(-dy, 0) : width - max(dy, 0)] = values[
+        max(dx, 0) : height - max(-dx, 0), max(dy, 0) : width - max(-dy, 0)
+    ]
+    return shifted
+
+
+def neighbor_stack(values: np.ndarray, diagonal: bool = False, fill: int = 0) -> np.ndarray:
+    directions = ALL_DIRECTIONS if diagonal else ORTHOGONAL_DIRECTIONS
+    return np.stack([shift(values, dx, dy, fill) for dx, dy in directions])
+
+
+def stencil(values: np.ndarray, weights: np.ndarray, fill: int = 0) -> np.ndarray:
+    # weighted sum of the 3x3 neighbourhood of every cell, weights[1, 1] is the weight of the cell itself
+    height, width = values.shape
+    padded = np.pad(values.astype(np.int64), 1, constant_values=fill)
+    result = np.zeros((height, width), dtype=np.int64)
+    for (i, j), weight in np.ndenumerate(weights):
+        if weight:
+            result += weight * padded[i : i + height, j : j + width]
+    return result
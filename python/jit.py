@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import functools
+import importlib.util
+from typing import Any, Callable, Optional
+
+# off runs the kernels as plain Python, on compiles them with numba and auto does so if numba is installed
+MODES = ("off", "auto", "on")
+mode = "off"
+
+
+@functools.lru_cache(maxsize=None)
+def is_available() -> bool:
+    return importlib.util.find_spec("numba") is not None
+
+
+def is_enabled() -> bool:
+    if mode == "on":
+        assert is_available(), "Compiling kernels needs numba"
+        return True
+    return mode == "auto" and is_available()
+
+
+class Kernel:
+    # kernels are scalar loops over numpy arrays and numbers, written in the subset of Python numba compiles; the
+    # implementation is chosen on the first call, so the mode has to be set before
+    def __init__(self, function: Callable[..., Any]) -> None:
+        functools.update_wrapper(self, function)
+        self.function = function
+        self._implementation: Optional[Callable[..., Any]] = None
+
+    def _resolve(self) -> Callable[..., Any]:
+        if is_enabled():
+            import numba
+
+            self._implementation = numba.njit(cache=True)(self.function)
+        else:
+            self._implementation = self.function
+        return self._implementation
+
+    @property
+    def is_compiled(self) -> bool:
+        # as plain Python a kernel is much slower than the vectorized reference, the strategies using it fall back
+        # to the reference then
+        return (self._implementation or self._resolve()) is not self.function
+
+    def __call__(self, *args: Any) -> Any:
+        return (self._implementation or self._resolve())(*args)
+
+
+def kernel(function: Callable[..., Any]) -> Kernel:
+    return Kernel(function)
@@ -1,33 +1,96 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os
+import sys
 from argparse import ArgumentParser, Namespace
-from importlib import import_module
 from time import time
+from typing import Dict, List, Optional
 
-from tqdm import tqdm
-
+import jit
 from day import Day
+from registry import DAY_MODULES, load_day_class
+
+# the modules of the different modes (and their dependencies) are imported lazily to keep the startup fast
 
 
 def parse_arguments() -> Namespace:
     parser = ArgumentParser()
     parser.add_argument("-t", "--test", action="store_true")
+    parser.add_argument("--incremental", action="store_true", help="skip days whose code and input are unchanged")
+    parser.add_argument("-j", "--jobs", type=int, help="run the tests or the batch in a pool of JOBS processes")
+    parser.add_argument("--batch", help="solve the day for every input file in a directory or matching a glob")
+    parser.add_argument("--batch-output", help="NDJSON file for the batch results instead of stdout")
+    parser.add_argument("--serve", action="store_true", help="keep parsed days resident and serve run requests")
+    parser.add_argument("--connect", action="store_true", help="run the day on a server started with --serve")
+    parser.add_argument("--stop-server", action="store_true", help="stop a server started with --serve")
+    parser.add_argument("--socket", default=".serve.sock", help="Unix socket of the server")
+    parser.add_argument("--startup-report", action="store_true", help="report the import time of the day (or all days)")
 
     parser.add_argument("-d", "--day", type=int)
     parser.add_argument("-1", "--part-1", action="store_true")
     parser.add_argument("-2", "--part-2", action="store_true")
 
+    parser.add_argument(
+        "--concurrent-parts", action="store_true", help="parse once and run the parts in separate processes"
+    )
+    parser.add_argument("--metrics", action="store_true", help="collect the work counters of the solvers")
+    parser.add_argument(
+        "--stream", action="store_true", help="solve the parts that support it in one pass over the input file"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="checkpoint long searches and continue from their last checkpoint"
+    )
+    parser.add_argument(
+        "--jit", choices=jit.MODES, default=jit.mode, help="compile the hot loops with numba (auto: if installed)"
+    )
+    parser.add_argument("--parse-cache", action="store_true", help="reuse parsed inputs of earlier runs")
+    parser.add_argument("-i", "--input", help="use this input file instead of the puzzle input")
+    parser.add_argument("--scale", type=float, nargs="+", help="use generated inputs of these scales")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the generated inputs")
+    parser.add_argument(
+        "--param",
+        action="append",
+        metavar="NAME=VALUE",
+        help="override a tunable parameter of the day, comma separated values are swept by --bench",
+    )
+
+    parser.add_argument("-b", "--bench", action="store_true", help="benchmark every phase of the day (or all days)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per phase")
+    parser.add_argument("--compare", action="store_true", help="cross-check and time all strategies of the parts")
+    parser.add_argument("--no-gc", action="store_true", help="disable the garbage collector during timed runs")
+    parser.add_argument("--bench-output", help="write benchmark results to a .json or .csv file")
+
+    parser.add_argument("-p", "--profile", action="store_true", help="profile the selected parts of the day")
+    parser.add_argument("--profile-parse", action="store_true", help="also profile parse_data")
+    parser.add_argument("--profile-top", type=int, default=20, help="number of functions in the summary")
+    parser.add_argument(
+        "--profile-sort", default="tottime", choices=["tottime", "cumulative", "ncalls"], help="order of the summary"
+    )
+
+    parser.add_argument("-m", "--mem", action="store_true", help="report the memory usage of every phase of the day")
+    parser.add_argument("--mem-top", type=int, default=10, help="number of allocation sites in the report")
+
+    parser.add_argument("--check-perf", action="store_true", help="fail if parts are slower than the baseline")
+    parser.add_argument("--update-perf-baseline", action="store_true", help="record the part timings as baseline")
+    parser.add_argument("--perf-tolerance", type=float, default=25, help="allowed slowdown in percent")
+    parser.add_argument("--baseline-revision", help="compare against this revision instead of the latest baseline")
+
     return parser.parse_args()
 
 
-def run_tests() -> None:
-    directories = [name for name in os.listdir(".") if os.path.isdir(name) and name.startswith("day_")]
-    for directory in directories:
-        import_module("{name}.{name}".format(name=directory))
-    for day_class in tqdm(sorted(Day.__subclasses__(), key=lambda cls: cls.__name__)):
+def run_tests(incremental: bool = False) -> None:
+    from tqdm import tqdm
+
+    from cache import is_verified, store_verified
+
+    for day_number in tqdm(DAY_MODULES):
+        day_class = load_day_class(day_number)
         day = day_class()
+        if incremental and is_verified(day):
+            tqdm.write("{} is unchanged since it was verified".format(day_class.__name__))
+            continue
+
         if day.part_1_solution is None:
             tqdm.write("Part 1 of {} is not implemented!".format(day_class.__name__))
         else:
@@ -37,34 +100,258 @@ def run_tests() -> None:
         else:
             assert day.part_2() == day.part_2_solution, "Part 2 is broken"
 
+        # days with parts that aren't implemented yet aren't verified
         if day.part_1_solution is not None and day.part_2_solution is not None:
             tqdm.write("{} is ok!".format(day_class.__name__))
+            if incremental:
+                store_verified(day)
+
+
+def print_metrics(day: Day) -> None:
+    from bench import format_metrics
+
+    if day.metrics:
+        print("Metrics:", format_metrics(day.metrics))
+        day.metrics = {}
+
+
+def selected_day_numbers(args: Namespace) -> List[int]:
+    if args.day:
+        return [args.day]
+    return list(DAY_MODULES)
+
+
+def selected_input_files(args: Namespace, day_number: int) -> List[Optional[str]]:
+    from generators import generated_input_file
+
+    if args.input:
+        return [args.input]
+    if args.scale:
+        return [generated_input_file(day_number, scale, args.seed) for scale in args.scale]
+    return [None]
+
+
+def parameter_sets(args: Namespace) -> List[Dict[str, str]]:
+    from itertools import product
+
+    names = []
+    value_lists = []
+    for parameter in args.param or []:
+        assert "=" in parameter, "Parameters must be given as NAME=VALUE, got {}".format(parameter)
+        name, values = parameter.split("=", 1)
+        names.append(name)
+        value_lists.append(values.split(","))
+    return [dict(zip(names, values)) for values in product(*value_lists)]
+
+
+def run_benchmarks(args: Namespace) -> None:
+    import platform
+
+    from bench import benchmark_day, print_results, write_results
+
+    results = []
+    for day_number in selected_day_numbers(args):
+        day_class = load_day_class(day_number)
+        for input_file in selected_input_files(args, day_number):
+            for parameters in parameter_sets(args):
+                results.extend(
+                    benchmark_day(day_class, input_file, parameters, args.warmup, args.repeat, args.no_gc)
+                )
+    print_results(results)
+
+    if args.bench_output:
+        settings = {
+            "machine": platform.node(),
+            "python": platform.python_version(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "gc_disabled": args.no_gc,
+            "metrics": args.metrics,
+        }
+        write_results(args.bench_output, results, settings)
+
+
+def measure_part_timings(args: Namespace) -> Dict[str, float]:
+    import statistics
+
+    from bench import measure
+    from timings import timing_key
+
+    # the baselines are keyed by day and part only
+    assert not (args.input or args.scale or args.param), "Baselines are for the puzzle inputs and default parameters"
+    timings = {}
+    for day_number in selected_day_numbers(args):
+        day = load_day_class(day_number)()
+        for part in (1, 2):
+            if getattr(day, "part_{}_solution".format(part)) is None:
+                continue
+            # only the part is timed, the input is loaded and parsed before every run
+            part_function = getattr(day, "part_{}".format(part))
+            durations = measure(part_function, day.reparse, args.warmup, args.repeat, args.no_gc)
+            timings[timing_key(type(day).__name__, part)] = statistics.median(durations)
+    return timings
+
+
+def run_perf_check(args: Namespace) -> None:
+    from timings import load_baseline, store_baseline
+
+    timings = measure_part_timings(args)
+    if args.update_perf_baseline:
+        revision = store_baseline(timings)
+        print("Stored baseline of {} parts for revision {}".format(len(timings), revision))
+        return
+
+    revision, baseline = load_baseline(args.baseline_revision)
+    assert baseline, "No performance baseline recorded on this machine, use --update-perf-baseline"
+    regressions = []
+    print("Comparing against baseline of revision {}".format(revision))
+    for key, duration in timings.items():
+        if key not in baseline:
+            print("{:<14} {:>10.2f}ms (no baseline)".format(key, 1000 * duration))
+            continue
+        change = 100 * (duration / baseline[key] - 1)
+        is_regression = change > args.perf_tolerance
+        marker = " REGRESSION" if is_regression else ""
+        print("{:<14} {:>10.2f}ms {:>+8.1f}%{}".format(key, 1000 * duration, change, marker))
+        if is_regression:
+            regressions.append(key)
+
+    assert not regressions, "Slower than the baseline by more than {}%: {}".format(
+        args.perf_tolerance, ", ".join(regressions)
+    )
 
 
 def main() -> None:
     args = parse_arguments()
+    # the other modes run the reference strategies on the parsed data
+    modes = ("test", "bench", "compare", "check_perf", "update_perf_baseline", "serve", "connect", "batch")
+    modes += ("profile", "mem", "concurrent_parts")
+    assert not args.stream or not any(getattr(args, mode) for mode in modes), "--stream only works for a plain run"
+    Day.use_parse_cache = args.parse_cache
+    Day.collect_metrics = args.metrics
+    Day.use_checkpoints = args.resume
+    Day.use_streaming = args.stream
+    jit.mode = args.jit
+
+    if args.check_perf or args.update_perf_baseline:
+        run_perf_check(args)
+        return
+
+    if args.bench:
+        run_benchmarks(args)
+        return
+
+    if args.compare:
+        from compare import compare_strategies
+
+        # the known solutions only hold for the real input with the default parameters
+        use_solutions = not (args.input or args.scale or args.param)
+        parts = [part for part in (1, 2) if getattr(args, "part_{}".format(part))] or [1, 2]
+        for day_number in selected_day_numbers(args):
+            for input_file in selected_input_files(args, day_number):
+                for parameters in parameter_sets(args):
+                    if parameters:
+                        print("Parameters: {}".format(", ".join("{}={}".format(*item) for item in parameters.items())))
+                    day = load_day_class(day_number)(input_file)
+                    day.configure(parameters)
+                    compare_strategies(day, parts, use_solutions, args.warmup, args.repeat, args.no_gc)
+        return
+
+    if args.startup_report:
+        from startup import report_startup
+
+        report_startup(selected_day_numbers(args))
+        return
+
+    if args.serve:
+        from serve import serve
+
+        serve(args.socket)
+        return
+
+    if args.stop_server:
+        from serve import send_request
+
+        send_request({"command": "stop"}, args.socket)
+        return
 
     if args.test:
-        run_tests()
+        if args.jobs:
+            from parallel import run_tests_parallel
+
+            run_tests_parallel(args.jobs, args.incremental, args.parse_cache)
+        else:
+            run_tests(args.incremental)
         return
 
-    assert args.day, "Need to specify day"
+    assert args.day in DAY_MODULES, "Need to specify day"
+
+    parameters = parameter_sets(args)
+    assert len(parameters) == 1, "Only --bench can sweep several parameter values"
+    parts = [part for part in (1, 2) if getattr(args, "part_{}".format(part))] or [1, 2]
+
+    # batches and the server load the day in their own processes
+    if args.batch:
+        from batch import batch_input_files, run_batch
 
-    directories = [name for name in os.listdir(".") if os.path.isdir(name) and name == "day_{:02d}".format(args.day)]
-    assert len(directories) == 1
-    import_module("{name}.{name}".format(name=directories[0]))
-    assert len(Day.__subclasses__()) == 1
+        input_files = batch_input_files(args.batch)
+        if args.batch_output:
+            with open(args.batch_output, "w") as fh:
+                run_batch(args.day, input_files, parts, parameters[0], args.jobs, args.parse_cache, args.metrics, fh)
+        else:
+            run_batch(args.day, input_files, parts, parameters[0], args.jobs, args.parse_cache, args.metrics)
+        return
+
+    if args.connect:
+        import os
+
+        from serve import send_request
+
+        for input_file in selected_input_files(args, args.day):
+            # the server may run in another directory
+            input_path = os.path.abspath(input_file) if input_file else None
+            for part in parts:
+                request = {"day": args.day, "part": part, "input": input_path, "parameters": parameters[0]}
+                response = send_request(request, args.socket)
+                assert "error" not in response, response.get("error")
+                print("Solution part {}: {} ({:.3f}ms)".format(part, response["result"], 1000 * response["duration"]))
+        return
 
-    day = Day.__subclasses__()[0]()
+    day = load_day_class(args.day)(selected_input_files(args, args.day)[0])
+    day.configure(parameters[0])
 
-    if args.part_1:
-        print("Solution part 1:", day.part_1())
+    if args.profile:
+        from profiling import profile_day
+
+        profile_day(day, parts, args.profile_parse, args.profile_top, args.profile_sort)
+        return
+
+    if args.mem:
+        from memory import report_memory
+
+        report_memory(day, parts, args.mem_top)
+        return
+
+    if args.concurrent_parts:
+        from parallel import run_parts_concurrently
+
+        for part, (result, duration) in sorted(run_parts_concurrently(day, parts).items()):
+            print("Solution part {}: {} ({:.3f}s)".format(part, result, duration))
+        return
 
-    if args.part_2:
-        print("Solution part 2:", day.part_2())
+    for part in parts:
+        # the other modes default to both parts, the plain run only solves the selected ones
+        if not getattr(args, "part_{}".format(part)):
+            continue
+        # the reference strategies of some days need the whole parsed data, they have a streaming strategy instead
+        strategies = day.strategies(part)
+        solve = strategies.get("streaming", strategies["reference"]) if args.stream else strategies["reference"]
+        print("Solution part {}:".format(part), solve())
+        print_metrics(day)
 
 
 if __name__ == "__main__":
     START_TIME = time()
     main()
-    print("Evaluation time {:.1f}s".format((time() - START_TIME)))
+    # on stderr, so that the output of --batch stays NDJSON
+    print("Evaluation time {:.1f}s".format((time() - START_TIME)), file=sys.stderr)
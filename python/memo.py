@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+# lru evicts the entry that was used the longest time ago, fifo the one that was added first
+POLICIES = ("lru", "fifo")
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+# keys made of these only are used as they are
+PLAIN_TYPES = frozenset((int, float, bool, str, bytes, type(None)))
+
+
+def normalize_key(value: Any) -> Hashable:
+    # numpy scalars hash like Python numbers but are slower to hash and compare, and keep their dtype in the key
+    if type(value) in PLAIN_TYPES:
+        return value
+    if isinstance(value, tuple):
+        if all(type(item) in PLAIN_TYPES for item in value):
+            return value
+        return tuple(normalize_key(item) for item in value)
+    if hasattr(value, "item") and not hasattr(value, "__len__"):
+        return value.item()
+    return value
+
+
+class Memo:
+    # caches the results of a function of hashable arguments; memos are created per solver run, so the counters
+    # describe that run, and recursive functions call the memo instead of themselves
+    def __init__(self, function: Callable[..., Any], capacity: Optional[int] = None, policy: str = "lru") -> None:
+        assert policy in POLICIES, "Unknown eviction policy {}, use one of: {}".format(policy, ", ".join(POLICIES))
+        assert capacity is None or capacity > 0, "The capacity of a memo has to be positive"
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __call__(self, *args: Any) -> Any:
+        key = normalize_key(args)
+        if key in self._results:
+            self.hits += 1
+            if self.policy == "lru":
+                self._results.move_to_end(key)
+            return self._results[key]
+
+        self.misses += 1
+        result = self.function(*args)
+        self._results[key] = result
+        if self.capacity is not None and len(self._results) > self.capacity:
+            self._results.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, args: Tuple[Any, ...]) -> bool:
+        return normalize_key(args) in self._results
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        # the cached results in eviction order, to save them in a checkpoint
+        return list(self._results.items())
+
+    def update(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        self._results.update(items)
+        while self.capacity is not None and len(self._results) > self.capacity:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def stats(self) -> MemoStats:
+        return MemoStats(self.hits, self.misses, self.evictions, len(self._results))
+
+    def record(self, count: Callable[[str, int], None], name: str) -> None:
+        # adds the counters to solver metrics, count is Day.count
+        count("{} hits".format(name), self.hits)
+        count("{} misses".format(name), self.misses)
+        if self.evictions:
+            count("{} evictions".format(name), self.evictions)
+
+
+def call_bottom_up(
+    memo: Memo, args: Tuple[Any, ...], dependencies: Callable[..., Iterable[Tuple[Any, ...]]]
+) -> Any:
+    # calls the memo on the arguments of the calls it makes first, so that it only recurses into cached results and
+    # long chains of calls don't exceed the recursion limit; the calls must not form a cycle
+    assert memo.capacity is None, "Evicted results would be computed again"
+    stack = [args]
+    expanded_keys = set()
+    while stack:
+        if stack[-1] in memo:
+            stack.pop()
+            continue
+        missing = [dependency for dependency in dependencies(*stack[-1]) if dependency not in memo]
+        if missing:
+            key = normalize_key(stack[-1])
+            assert key not in expanded_keys, "The calls of {} form a cycle".format(memo.__name__)
+            expanded_keys.add(key)
+            stack.extend(missing)
+        else:
+            memo(*stack.pop())
+    return memo(*args)
+
+
+def memoize(capacity: Optional[int] = None, policy: str = "lru") -> Callable[[Callable[..., Any]], Memo]:
+    def decorate(function: Callable[..., Any]) -> Memo:
+        return Memo(function, capacity, policy)
+
+    return decorate
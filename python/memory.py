@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+from day import Day
+
+# snapshots are expensive, only take a new one when the traced memory grew by this factor
+SNAPSHOT_GROWTH_FACTOR = 1.25
+MIN_SNAPSHOT_SIZE = 64 * 1024
+
+
+class PeakSnapshotter:
+    def __init__(self, base_size: int) -> None:
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._base_size = base_size
+        self._snapshot_size = 0
+
+    def __call__(self, frame, event: str, arg) -> None:
+        size = tracemalloc.get_traced_memory()[0] - self._base_size
+        if size >= max(SNAPSHOT_GROWTH_FACTOR * self._snapshot_size, MIN_SNAPSHOT_SIZE):
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = size
+
+
+def _format_size(size: int) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return "{:.1f} {}".format(size, unit)
+        size /= 1024
+    return "{:.1f} GiB".format(size)
+
+
+def measure_memory(function: Callable[[], object], top: int) -> Tuple[int, int, int, List[tracemalloc.StatisticDiff]]:
+    tracemalloc.start()
+    try:
+        base_snapshot = tracemalloc.take_snapshot()
+        base_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        snapshotter = PeakSnapshotter(base_size)
+        sys.setprofile(snapshotter)
+        try:
+            function()
+        finally:
+            sys.setprofile(None)
+        current_size, peak_size = tracemalloc.get_traced_memory()
+        peak_snapshot = snapshotter.snapshot or tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # don't report the memory used by the snapshots themselves
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    statistics = peak_snapshot.filter_traces(filters).compare_to(base_snapshot.filter_traces(filters), "lineno")
+    allocated_blocks = sum(statistic.count_diff for statistic in statistics if statistic.count_diff > 0)
+    top_statistics = [statistic for statistic in statistics if statistic.size_diff > 0][:top]
+    return peak_size - base_size, current_size - base_size, allocated_blocks, top_statistics
+
+
+def report_memory(day: Day, parts: List[int], top: int) -> None:
+    def parse() -> None:
+        day.data = day.parse_data()
+
+    # the text is loaded up front, it isn't part of any phase
+    day.raw_data
+
+    phases: List[Tuple[str, Callable[[], object]]] = [("parse_data", parse)]
+    phases.extend(("part_{}".format(part), getattr(day, "part_{}".format(part))) for part in parts)
+
+    for phase, function in phases:
+        peak_size, retained_size, allocated_blocks, top_statistics = measure_memory(function, top)
+        print(
+            "{} {}: peak {}, retained {}, {} blocks allocated at the peak".format(
+                type(day).__name__, phase, _format_size(peak_size), _format_size(retained_size), allocated_blocks
+            )
+        )
+        for statistic in top_statistics:
+            frame = statistic.traceback[0]
+            print(
+                "  {:>12} in {:>8} blocks  {}:{}".format(
+                    _format_size(statistic.size_diff), statistic.count_diff, frame.filename, frame.lineno
+                )
+            )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache import is_verified, store_verified
+from day import Day
+from registry import DAY_MODULES, day_class_name, load_day_class
+from timings import load_timings, store_timings, timing_key
+
+# the day, the part, whether it's correct (None if it isn't implemented), its duration and the error it raised
+PartResult = Tuple[str, int, Optional[bool], float, Optional[str]]
+
+
+def _initialize_worker(use_parse_cache: bool) -> None:
+    Day.use_parse_cache = use_parse_cache
+
+
+def _run_part(day_number: int, part: int) -> PartResult:
+    day_name = day_class_name(day_number)
+    try:
+        day = load_day_class(day_number)()
+        solution = getattr(day, "part_{}_solution".format(part))
+        if solution is None:
+            return day_name, part, None, 0.0, None
+        # the import and the parse aren't part of the timing
+        day.data
+        start_time = perf_counter()
+        result = getattr(day, "part_{}".format(part))()
+        return day_name, part, result == solution, perf_counter() - start_time, None
+    except Exception as error:
+        return day_name, part, False, 0.0, "{}: {}".format(type(error).__name__, error)
+
+
+def run_tests_parallel(jobs: int, incremental: bool = False, use_parse_cache: bool = False) -> None:
+    timings = load_timings()
+    days = {day_class_name(day_number): load_day_class(day_number)() for day_number in DAY_MODULES}
+    if incremental:
+        for day_name in [day_name for day_name, day in days.items() if is_verified(day)]:
+            print("{} is unchanged since it was verified".format(day_name))
+            del days[day_name]
+    tasks = [(day.day_number, part) for day in days.values() for part in (1, 2)]
+
+    def expected_duration(task: Tuple[int, int]) -> float:
+        # days without recorded timings are scheduled first, they might be slow
+        return timings.get(timing_key(day_class_name(task[0]), task[1]), float("inf"))
+
+    tasks.sort(key=expected_duration, reverse=True)
+
+    new_timings = {}
+    broken_parts = []
+    pending_parts: Dict[str, int] = {day_name: 2 for day_name in days}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_initialize_worker, initargs=(use_parse_cache,)) as executor:
+        futures = [executor.submit(_run_part, day_number, part) for day_number, part in tasks]
+        for future in as_completed(futures):
+            day_name, part, is_correct, duration, error = future.result()
+            # only days whose parts all match their solutions are verified
+            if is_correct:
+                pending_parts[day_name] -= 1
+                if incremental and pending_parts[day_name] == 0:
+                    store_verified(days[day_name])
+            if is_correct is None:
+                print("Part {} of {} is not implemented!".format(part, day_name))
+                continue
+
+            if error is not None:
+                print("Part {} of {} failed! {}".format(part, day_name, error))
+                broken_parts.append((day_name, part))
+                continue
+
+            new_timings[timing_key(day_name, part)] = duration
+            if is_correct:
+                print("Part {} of {} is ok! ({:.2f}s)".format(part, day_name, duration))
+            else:
+                print("Part {} of {} is broken!".format(part, day_name))
+                broken_parts.append((day_name, part))
+
+    store_timings(new_timings)
+    assert not broken_parts, "Broken parts: {}".format(broken_parts)
+
+
+def _run_part_on_shared_data(
+    day_number: int, input_file: str, parameters: Dict[str, int], shared_data: Any, part: int
+) -> Tuple[int, Any, float]:
+    from shared import attach_data
+
+    day = load_day_class(day_number)(input_file)
+    day.configure(parameters)
+    day.data, blocks = attach_data(shared_data)
+    try:
+        start_time = perf_counter()
+        result = getattr(day, "part_{}".format(part))()
+        return part, result, perf_counter() - start_time
+    finally:
+        # the shared memory can only be closed once no array uses it anymore, the worker runs further parts
+        del day
+        gc.collect()
+        for block in blocks:
+            block.close()
+
+
+def run_parts_concurrently(day: Day, parts: List[int]) -> Dict[int, Tuple[Any, float]]:
+    from shared import release_blocks, share_data
+
+    # the day is parsed once, the parts run in their own processes on the shared parsed data
+    shared_data, blocks = share_data(day.data)
+    try:
+        with ProcessPoolExecutor(max_workers=len(parts)) as executor:
+            futures = [
+                executor.submit(
+                    _run_part_on_shared_data, day.day_number, day.input_file, day.parameters, shared_data, part
+                )
+                for part in parts
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        release_blocks(blocks)
+    return {part: (result, duration) for part, result, duration in results}
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Sequence, Union
+
+import numpy as np
+
+# every byte except digits and minus signs becomes a separator
+_SEPARATORS = bytes(byte if byte in b"0123456789-" else ord(" ") for byte in range(256))
+
+Text = Union[bytes, bytearray, memoryview]
+
+
+def integer_table(text: Text, columns: Sequence[str]) -> np.ndarray:
+    # all integers in the text in one pass, as rows of the declared columns, e.g. ("x1", "y1", "x2", "y2") for
+    # "1,2 -> 3,4"; the text must not contain other numbers, minus signs only count in front of a digit ("->")
+    separated = bytes(text).translate(_SEPARATORS).replace(b"- ", b"  ")
+    values = np.fromstring(separated, dtype=np.int64, sep=" ")
+    assert values.size % len(columns) == 0, "{} integers don't fill rows of {}".format(values.size, ", ".join(columns))
+    return values.reshape(-1, len(columns))
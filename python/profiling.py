@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import cProfile
+import io
+import os
+import pstats
+from typing import Callable, List, Tuple
+
+from day import Day
+
+PROFILE_DIRECTORY = "profiles"
+
+
+def _profile(function: Callable[[], object], file_name: str, top: int, sort_key: str) -> str:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        function()
+    finally:
+        profiler.disable()
+    profiler.dump_stats(file_name + ".prof")
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats(sort_key).print_stats(top)
+    with open(file_name + ".txt", "w") as fh:
+        fh.write(summary.getvalue())
+    return summary.getvalue()
+
+
+def profile_day(day: Day, parts: List[int], include_parse: bool, top: int, sort_key: str) -> None:
+    day_name = type(day).__name__
+    # make sure neither loading nor (unless requested) parsing end up in the profile of the first phase
+    if include_parse:
+        day.raw_data
+    else:
+        day.data
+    phases: List[Tuple[str, Callable[[], object]]] = []
+    if include_parse:
+
+        def parse() -> None:
+            day.data = day.parse_data()
+
+        phases.append(("parse_data", parse))
+    phases.extend(("part_{}".format(part), getattr(day, "part_{}".format(part))) for part in parts)
+
+    os.makedirs(PROFILE_DIRECTORY, exist_ok=True)
+    for phase, function in phases:
+        file_name = os.path.join(PROFILE_DIRECTORY, "{}_{}".format(day_name, phase))
+        summary = _profile(function, file_name, top, sort_key)
+        print("Hottest functions of {} {} (full profile in {}.prof):".format(day_name, phase, file_name))
+        print(summary)
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Type
+
+if TYPE_CHECKING:
+    from day import Day
+
+# static so that running a single day doesn't need to scan the directory or import any other day
+DAY_MODULES: Dict[int, str] = {day_number: "day_{0:02d}.day_{0:02d}".format(day_number) for day_number in range(1, 26)}
+
+
+def day_class_name(day_number: int) -> str:
+    return "Day{:02d}".format(day_number)
+
+
+def load_day_class(day_number: int) -> Type["Day"]:
+    return getattr(import_module(DAY_MODULES[day_number]), day_class_name(day_number))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
+
+from jit import kernel
+from memo import Memo, call_bottom_up
+
+if TYPE_CHECKING:
+    from cache import Checkpoint
+
+State = TypeVar("State", bound=Hashable)
+Successors = Callable[[State], Iterable[Tuple[State, int]]]
+
+
+class SearchResult(NamedTuple):
+    cost: Optional[int]
+    path: Optional[List[Any]]
+    expanded_count: int
+
+
+def _reconstruct_path(parents: Dict[State, Optional[State]], state: State) -> List[State]:
+    path = [state]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    return path[::-1]
+
+
+def shortest_path(
+    start: State,
+    successors: Successors,
+    is_goal: Callable[[State], bool],
+    heuristic: Optional[Callable[[State], int]] = None,
+    with_path: bool = False,
+    checkpoint: Optional["Checkpoint"] = None,
+) -> SearchResult:
+    # Dijkstra, or A* if a consistent heuristic (a lower bound of the remaining cost) is given; a checkpoint keeps
+    # the frontier, the caller clears it once it has the result
+    best_costs = {start: 0}
+    parents: Dict[State, Optional[State]] = {start: None}
+    # the counter breaks ties, so the states don't need to be comparable
+    tie_breaker = count()
+    queue = [(heuristic(start) if heuristic else 0, next(tie_breaker), 0, start)]
+    expanded_count = 0
+    resumed_state = checkpoint.load() if checkpoint is not None else None
+    if resumed_state is not None:
+        best_costs, parents, queue, expanded_count, next_tie = resumed_state
+        tie_breaker = count(next_tie)
+    while queue:
+        if checkpoint is not None and checkpoint.is_due:
+            checkpoint.save((best_costs, parents, queue, expanded_count, next(tie_breaker)))
+        _, _, cost, state = heappop(queue)
+        if cost > best_costs[state]:
+            continue
+        if is_goal(state):
+            return SearchResult(cost, _reconstruct_path(parents, state) if with_path else None, expanded_count)
+
+        expanded_count += 1
+        for next_state, step_cost in successors(state):
+            next_cost = cost + step_cost
+            if next_cost >= best_costs.get(next_state, next_cost + 1):
+                continue
+            best_costs[next_state] = next_cost
+            if with_path:
+                parents[next_state] = state
+            estimate = next_cost + heuristic(next_state) if heuristic else next_cost
+            heappush(queue, (estimate, next(tie_breaker), next_cost, next_state))
+    return SearchResult(None, None, expanded_count)
+
+
+def bucket_shortest_path(
+    offsets: Sequence[int],
+    neighbors: Sequence[int],
+    node_costs: Sequence[int],
+    start: int,
+    target: int,
+    with_path: bool = False,
+) -> SearchResult:
+    # Dial's algorithm on a graph of numbered nodes in CSR form (see grid.neighbor_table), where entering a node
+    # costs node_costs[node]; small integer costs allow a ring of buckets instead of a heap
+    bucket_count = max(node_costs) + 1
+    buckets: List[List[int]] = [[] for _ in range(bucket_count)]
+    best_costs = [-1] * len(node_costs)
+    parents = [-1] * len(node_costs) if with_path else None
+    is_done = bytearray(len(node_costs))
+    best_costs[start] = 0
+    buckets[0].append(start)
+    pending_count = 1
+    cost = 0
+    expanded_count = 0
+    while pending_count:
+        bucket = buckets[cost % bucket_count]
+        while bucket:
+            node = bucket.pop()
+            pending_count -= 1
+            if is_done[node] or best_costs[node] != cost:
+                continue
+            if node == target:
+                path = None
+                if parents is not None:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                return SearchResult(cost, path, expanded_count)
+
+            is_done[node] = True
+            expanded_count += 1
+            for neighbor in neighbors[offsets[node] : offsets[node + 1]]:
+                next_cost = cost + node_costs[neighbor]
+                if is_done[neighbor] or 0 <= best_costs[neighbor] <= next_cost:
+                    continue
+                best_costs[neighbor] = next_cost
+                if parents is not None:
+                    parents[neighbor] = node
+                buckets[next_cost % bucket_count].append(neighbor)
+                pending_count += 1
+        cost += 1
+    return SearchResult(None, None, expanded_count)
+
+
+@kernel
+def bucket_shortest_path_kernel(
+    offsets: np.ndarray, neighbors: np.ndarray, node_costs: np.ndarray, start: int, target: int, with_path: bool
+) -> Tuple[int, np.ndarray]:
+    # bucket_shortest_path as a kernel on arrays, the buckets are linked lists of entries; the cost is -1 if there
+    # is no path, the path is empty unless it's requested
+    bucket_count = node_costs.max() + 1
+    bucket_heads = np.full(bucket_count, -1, dtype=np.int64)
+    # there is at most one entry per improved cost, so per edge
+    entry_nodes = np.empty(neighbors.shape[0] + 1, dtype=np.int64)
+    next_entries = np.empty(neighbors.shape[0] + 1, dtype=np.int64)
+    best_costs = np.full(node_costs.shape[0], -1, dtype=np.int64)
+    parents = np.full(node_costs.shape[0], -1, dtype=np.int64)
+    is_done = np.zeros(node_costs.shape[0], dtype=np.bool_)
+    best_costs[start] = 0
+    entry_nodes[0] = start
+    next_entries[0] = -1
+    bucket_heads[0] = 0
+    entry_count = 1
+    pending_count = 1
+    cost = 0
+    while pending_count > 0:
+        bucket = cost % bucket_count
+        while bucket_heads[bucket] != -1:
+            entry = bucket_heads[bucket]
+            bucket_heads[bucket] = next_entries[entry]
+            pending_count -= 1
+            node = entry_nodes[entry]
+            if is_done[node] or best_costs[node] != cost:
+                continue
+            if node == target:
+                path_length = 0
+                if with_path:
+                    path_length = 1
+                    while node != start:
+                        node = parents[node]
+                        path_length += 1
+                path = np.empty(path_length, dtype=np.int64)
+                node = target
+                for k in range(path_length - 1, -1, -1):
+                    path[k] = node
+                    node = parents[node]
+                return cost, path
+
+            is_done[node] = True
+            for k in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbors[k]
+                next_cost = cost + node_costs[neighbor]
+                if is_done[neighbor] or 0 <= best_costs[neighbor] <= next_cost:
+                    continue
+                best_costs[neighbor] = next_cost
+                parents[neighbor] = node
+                next_bucket = next_cost % bucket_count
+                entry_nodes[entry_count] = neighbor
+                next_entries[entry_count] = bucket_heads[next_bucket]
+                bucket_heads[next_bucket] = entry_count
+                entry_count += 1
+                pending_count += 1
+        cost += 1
+    return -1, np.empty(0, dtype=np.int64)
+
+
+def breadth_first(start: State, successors: Callable[[State], Iterable[State]]) -> Dict[State, int]:
+    # the number of steps to every reachable state
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        for next_state in successors(state):
+            if next_state not in distances:
+                distances[next_state] = distances[state] + 1
+                queue.append(next_state)
+    return distances
+
+
+def count_paths(
+    start: State, successors: Callable[[State], Iterable[State]], is_goal: Callable[[State], bool]
+) -> Tuple[int, Memo]:
+    # the number of paths to a goal and the memo of the path counts of the distinct states, the state graph has to
+    # be acyclic
+    def paths_from(state: State) -> int:
+        return int(is_goal(state)) + sum(memo(next_state) for next_state in successors(state))
+
+    memo = Memo(paths_from)
+    path_count = call_bottom_up(memo, (start,), lambda state: ((next_state,) for next_state in successors(state)))
+    return path_count, memo
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import socket
+import socketserver
+from time import perf_counter
+from typing import Any, Dict, Optional, Tuple
+
+from day import Day
+from registry import DAY_MODULES, load_day_class
+
+SOCKET_FILE = ".serve.sock"
+
+Request = Dict[str, Any]
+Response = Dict[str, Any]
+
+
+def json_default(value: Any) -> Any:
+    # numpy scalars
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class DayServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_file: str) -> None:
+        super().__init__(socket_file, DayRequestHandler)
+        self.parsed_days: Dict[Tuple[int, Optional[str]], Day] = {}
+        self.stopped = False
+
+    def parsed_day(self, day_number: int, input_file: Optional[str]) -> Tuple[Day, float]:
+        key = (day_number, input_file)
+        if key in self.parsed_days:
+            return self.parsed_days[key], 0.0
+
+        start_time = perf_counter()
+        day = load_day_class(day_number)(input_file)
+        day.data
+        self.parsed_days[key] = day
+        return day, perf_counter() - start_time
+
+    def run(self, request: Request) -> Response:
+        day_number = request["day"]
+        assert day_number in DAY_MODULES, "Unknown day {}".format(day_number)
+        parsed_day, parse_duration = self.parsed_day(day_number, request.get("input"))
+
+        # the parsed data is immutable, so every request can share it
+        day = type(parsed_day)(parsed_day.input_file)
+        day.configure(request.get("parameters", {}))
+        day.data = parsed_day.data
+        start_time = perf_counter()
+        result = getattr(day, "part_{}".format(request["part"]))()
+        return {
+            "day": type(day).__name__,
+            "part": request["part"],
+            "result": result,
+            "parse_duration": parse_duration,
+            "duration": perf_counter() - start_time,
+        }
+
+
+class DayRequestHandler(socketserver.StreamRequestHandler):
+    server: DayServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get("command") == "stop":
+                self.server.stopped = True
+                self.wfile.write(b'{"stopped": true}\n')
+                return
+
+            try:
+                response = self.server.run(request)
+            except Exception as error:
+                response = {"error": "{}: {}".format(type(error).__name__, error)}
+            self.wfile.write(json.dumps(response, default=json_default).encode() + b"\n")
+            self.wfile.flush()
+
+
+def serve(socket_file: str = SOCKET_FILE) -> None:
+    if os.path.exists(socket_file):
+        os.remove(socket_file)
+    with DayServer(socket_file) as server:
+        print("Serving on {}".format(socket_file))
+        try:
+            while not server.stopped:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_file)
+
+
+def send_request(request: Request, socket_file: str = SOCKET_FILE) -> Response:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_file)
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        with connection.makefile("rb") as fh:
+            return json.loads(fh.readline())
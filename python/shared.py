@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from multiprocessing.shared_memory import SharedMemory
+from types import MappingProxyType
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+
+class SharedArray(NamedTuple):
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _rebuild_tuple(item: tuple, elements: Iterable[Any]) -> tuple:
+    # named tuples keep their type, other tuples become plain ones
+    if hasattr(item, "_fields"):
+        return type(item)._make(elements)
+    return tuple(elements)
+
+
+def share_data(data: Any) -> Tuple[Any, List[SharedMemory]]:
+    # replaces the numpy arrays in the parsed data by references to shared memory blocks
+    blocks = []
+
+    def share(item: Any) -> Any:
+        if isinstance(item, np.ndarray) and item.dtype != object and item.nbytes > 0:
+            block = SharedMemory(create=True, size=item.nbytes)
+            np.ndarray(item.shape, item.dtype, buffer=block.buf)[...] = item
+            blocks.append(block)
+            return SharedArray(block.name, item.shape, item.dtype.str)
+        if isinstance(item, tuple):
+            return _rebuild_tuple(item, (share(element) for element in item))
+        if isinstance(item, list):
+            return [share(element) for element in item]
+        # read-only views of frozen dicts can't be pickled, the worker freezes the attached data again
+        if isinstance(item, (dict, MappingProxyType)):
+            return {key: share(value) for key, value in item.items()}
+        return item
+
+    return share(data), blocks
+
+
+def attach_data(shared_data: Any) -> Tuple[Any, List[SharedMemory]]:
+    # the blocks have to stay open for as long as the arrays are used
+    blocks = []
+
+    def attach(item: Any) -> Any:
+        if isinstance(item, SharedArray):
+            block = SharedMemory(name=item.name)
+            blocks.append(block)
+            array = np.ndarray(item.shape, np.dtype(item.dtype), buffer=block.buf)
+            array.flags.writeable = False
+            return array
+        if isinstance(item, tuple):
+            return _rebuild_tuple(item, (attach(element) for element in item))
+        if isinstance(item, list):
+            return [attach(element) for element in item]
+        if isinstance(item, dict):
+            return {key: attach(value) for key, value in item.items()}
+        return item
+
+    return attach(shared_data), blocks
+
+
+def release_blocks(blocks: List[SharedMemory]) -> None:
+    for block in blocks:
+        block.close()
+        block.unlink()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from typing import List, Tuple
+
+from registry import DAY_MODULES
+
+ImportTime = Tuple[int, str, int]
+
+
+def _measure_import_times(module_name: str) -> List[ImportTime]:
+    # a fresh interpreter per module, otherwise dependencies shared with earlier modules would be free
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(module_name)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = []
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        import_times.append((depth, name.strip(), int(cumulative)))
+    return import_times
+
+
+def _direct_dependencies(import_times: List[ImportTime], module_name: str) -> List[Tuple[str, int]]:
+    # children are reported before their parent and are indented one level deeper
+    index = next(i for i, (_, name, _) in enumerate(import_times) if name == module_name)
+    module_depth = import_times[index][0]
+    dependencies = []
+    for depth, name, cumulative in reversed(import_times[:index]):
+        if depth <= module_depth:
+            break
+        if depth == module_depth + 1:
+            dependencies.append((name, cumulative))
+    return sorted(dependencies, key=lambda dependency: dependency[1], reverse=True)
+
+
+def report_startup(day_numbers: List[int], dependency_count: int = 5) -> None:
+    print("{:<16} {:>10}  {}".format("module", "total [ms]", "slowest direct imports [ms]"))
+    for module_name in ["main"] + [DAY_MODULES[day_number] for day_number in day_numbers]:
+        import_times = _measure_import_times(module_name)
+        total = next(cumulative for _, name, cumulative in import_times if name == module_name)
+        dependencies = _direct_dependencies(import_times, module_name)[:dependency_count]
+        print(
+            "{:<16} {:>10.1f}  {}".format(
+                module_name,
+                total / 1000,
+                ", ".join("{} {:.1f}".format(name, cumulative / 1000) for name, cumulative in dependencies),
+            )
+        )
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import platform
+import subprocess
+from typing import Dict, Optional, Tuple
+
+TIMINGS_FILE = ".timings.json"
+BASELINE_FILE = "perf_baselines.json"
+
+
+def timing_key(day_name: str, part: int) -> str:
+    return "{} part {}".format(day_name, part)
+
+
+def load_timings() -> Dict[str, float]:
+    if not os.path.exists(TIMINGS_FILE):
+        return {}
+    with open(TIMINGS_FILE) as fh:
+        return json.load(fh)
+
+
+def store_timings(timings: Dict[str, float]) -> None:
+    recorded_timings = load_timings()
+    recorded_timings.update(timings)
+    with open(TIMINGS_FILE, "w") as fh:
+        json.dump(recorded_timings, fh, indent=2, sort_keys=True)
+
+
+def git_revision() -> str:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return output.stdout.strip()
+
+
+def _load_baselines() -> Dict[str, Dict[str, Dict[str, float]]]:
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE) as fh:
+        return json.load(fh)
+
+
+def load_baseline(revision: Optional[str] = None) -> Tuple[Optional[str], Dict[str, float]]:
+    machine_baselines = _load_baselines().get(platform.node(), {})
+    if not machine_baselines:
+        return None, {}
+    if revision is None:
+        # baselines are stored in the order they were recorded
+        revision = list(machine_baselines)[-1]
+    return revision, machine_baselines.get(revision, {})
+
+
+def store_baseline(timings: Dict[str, float]) -> str:
+    baselines = _load_baselines()
+    machine_baselines = baselines.setdefault(platform.node(), {})
+    revision = git_revision()
+    # re-insert the revision so it becomes the latest baseline
+    revision_timings = machine_baselines.pop(revision, {})
+    revision_timings.update(timings)
+    machine_baselines[revision] = revision_timings
+    with open(BASELINE_FILE, "w") as fh:
+        json.dump(baselines, fh, indent=2)
+    return revision